@@ -6,27 +6,9 @@ from nle.minihack.base import MiniHack
 from nle.minihack.navigation import MiniHackNavigation
 from nle.minihack.skills import MiniHackSkill
 from nle.minihack.wiki import NetHackWiki
+from nle.minihack.vector import MiniHackVecEnv
 
-import nle.minihack.envs.room
-import nle.minihack.envs.corridor
-import nle.minihack.envs.keyroom
-import nle.minihack.envs.mazewalk
-import nle.minihack.envs.fightcorridor
-import nle.minihack.envs.minigrid
-import nle.minihack.envs.memento
-import nle.minihack.envs.boxohack
-import nle.minihack.envs.river
-import nle.minihack.envs.hidenseek
-import nle.minihack.envs.lab
-import nle.minihack.envs.exploremaze
-import nle.minihack.envs.skills_simple
-import nle.minihack.envs.skills_wod
-import nle.minihack.envs.skills_levitate
-import nle.minihack.envs.skills_freeze
-import nle.minihack.envs.skills_invis
-import nle.minihack.envs.skills_lava
-import nle.minihack.envs.skills_chest
-import nle.minihack.envs.skills_quest
+import nle.minihack._registration
 
 __all__ = [
     "MiniHack",
@@ -35,4 +17,5 @@ __all__ = [
     "LevelGenerator",
     "RewardManager",
     "NetHackWiki",
+    "MiniHackVecEnv",
 ]
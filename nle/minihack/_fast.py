@@ -0,0 +1,50 @@
+# Copyright (c) Facebook, Inc. and its affiliates.
+"""Numba kernels for the per-step MiniHack observation processing.
+
+Numba is optional (pip install nle[numba]) and is only imported, and the
+kernels compiled, when the first MiniHack environment is created. If it is
+not installed, the getters return None and MiniHack falls back to its NumPy
+implementation.
+"""
+
+import functools
+
+import numpy as np
+
+
+def _crop_observation(obs, x, y, dh, dw, pad, buf):
+    """Crops obs around (x, y) into buf, padding outside of the map with
+    pad, and returns buf."""
+    h, w = obs.shape[0], obs.shape[1]
+
+    # Intersection of the crop window with the map
+    syt, syb = max(y - dh, 0), min(y + dh + 1, h)
+    sxl, sxr = max(x - dw, 0), min(x + dw + 1, w)
+    dyt, dxl = syt - (y - dh), sxl - (x - dw)
+
+    buf[:] = pad
+    if syt < syb and sxl < sxr:
+        buf[dyt : dyt + syb - syt, dxl : dxl + sxr - sxl] = obs[syt:syb, sxl:sxr]
+    return buf
+
+
+@functools.lru_cache(maxsize=None)
+def get_crop_observation():
+    """Returns the compiled crop kernel, or None if numba isn't installed.
+
+    The kernel is compiled for the observation types MiniHack crops on the
+    first call, so that the first step isn't slow.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    crop_observation = numba.njit(cache=True)(_crop_observation)
+    for shape, dtype in (
+        ((3, 3), np.uint8),  # chars, colors, tty_chars, tty_colors
+        ((3, 3), np.uint16),  # glyphs
+        ((3, 3, 2), np.uint8),  # screen_descriptions
+    ):
+        crop_observation(np.zeros(shape, dtype), 1, 1, 1, 1, 0, np.zeros(shape, dtype))
+    return crop_observation
@@ -0,0 +1,604 @@
+# Copyright (c) Facebook, Inc. and its affiliates.
+"""Registers the MiniHack environments with gym.
+
+Only entry points are given, so that an environment module is imported by
+gym.make rather than when nle.minihack is imported.
+"""
+
+from gym.envs import registration
+
+# Room
+registration.register(
+    id="MiniHack-Room-5x5-v0",
+    entry_point="nle.minihack.envs.room:MiniHackRoom5x5",
+)
+registration.register(
+    id="MiniHack-Room-Random-5x5-v0",
+    entry_point="nle.minihack.envs.room:MiniHackRoom5x5Random",
+)
+registration.register(
+    id="MiniHack-Room-Dark-5x5-v0",
+    entry_point="nle.minihack.envs.room:MiniHackRoom5x5Dark",
+)
+registration.register(
+    id="MiniHack-Room-Monster-5x5-v0",
+    entry_point="nle.minihack.envs.room:MiniHackRoom5x5Monster",
+)
+registration.register(
+    id="MiniHack-Room-Trap-5x5-v0",
+    entry_point="nle.minihack.envs.room:MiniHackRoom5x5Trap",
+)
+registration.register(
+    id="MiniHack-Room-Ultimate-5x5-v0",
+    entry_point="nle.minihack.envs.room:MiniHackRoom5x5Ultimate",
+)
+registration.register(
+    id="MiniHack-Room-15x15-v0",
+    entry_point="nle.minihack.envs.room:MiniHackRoom15x15",
+)
+registration.register(
+    id="MiniHack-Room-Random-15x15-v0",
+    entry_point="nle.minihack.envs.room:MiniHackRoom15x15Random",
+)
+registration.register(
+    id="MiniHack-Room-Dark-15x15-v0",
+    entry_point="nle.minihack.envs.room:MiniHackRoom15x15Dark",
+)
+registration.register(
+    id="MiniHack-Room-Monster-15x15-v0",
+    entry_point="nle.minihack.envs.room:MiniHackRoom15x15Monster",
+)
+registration.register(
+    id="MiniHack-Room-Trap-15x15-v0",
+    entry_point="nle.minihack.envs.room:MiniHackRoom15x15Trap",
+)
+registration.register(
+    id="MiniHack-Room-Ultimate-15x15-v0",
+    entry_point="nle.minihack.envs.room:MiniHackRoom15x15Ultimate",
+)
+
+# Corridor
+registration.register(
+    id="MiniHack-Corridor-R2-v0",
+    entry_point="nle.minihack.envs.corridor:MiniHackCorridor2",
+)
+registration.register(
+    id="MiniHack-Corridor-R3-v0",
+    entry_point="nle.minihack.envs.corridor:MiniHackCorridor3",
+)
+registration.register(
+    id="MiniHack-Corridor-R5-v0",
+    entry_point="nle.minihack.envs.corridor:MiniHackCorridor5",
+)
+
+# KeyRoom
+registration.register(
+    id="MiniHack-KeyRoom-Fixed-S5-v0",
+    entry_point="nle.minihack.envs.keyroom:MiniHackKeyRoom5x5Fixed",
+)
+registration.register(
+    id="MiniHack-KeyRoom-S5-v0",
+    entry_point="nle.minihack.envs.keyroom:MiniHackKeyRoom5x5",
+)
+registration.register(
+    id="MiniHack-KeyRoom-S15-v0",
+    entry_point="nle.minihack.envs.keyroom:MiniHackKeyRoom15x15",
+)
+registration.register(
+    id="MiniHack-KeyRoom-Unlit-S5-v0",
+    entry_point="nle.minihack.envs.keyroom:MiniHackKeyRoom5x5Dark",
+)
+registration.register(
+    id="MiniHack-KeyRoom-Unlit-S15-v0",
+    entry_point="nle.minihack.envs.keyroom:MiniHackKeyRoom15x15Dark",
+)
+
+# MazeWalk
+registration.register(
+    id="MiniHack-MazeWalk-9x9-v0",
+    entry_point="nle.minihack.envs.mazewalk:MiniHackMazeWalk9x9",
+)
+registration.register(
+    id="MiniHack-MazeWalk-Premapped-9x9-v0",
+    entry_point="nle.minihack.envs.mazewalk:MiniHackMazeWalk9x9Premapped",
+)
+registration.register(
+    id="MiniHack-MazeWalk-15x15-v0",
+    entry_point="nle.minihack.envs.mazewalk:MiniHackMazeWalk15x15",
+)
+registration.register(
+    id="MiniHack-MazeWalk-Premapped-15x15-v0",
+    entry_point="nle.minihack.envs.mazewalk:MiniHackMazeWalk15x15Premapped",
+)
+registration.register(
+    id="MiniHack-MazeWalk-45x19-v0",
+    entry_point="nle.minihack.envs.mazewalk:MiniHackMazeWalk45x19",
+)
+registration.register(
+    id="MiniHack-MazeWalk-Premapped-45x19-v0",
+    entry_point="nle.minihack.envs.mazewalk:MiniHackMazeWalk45x19Premapped",
+)
+
+# Fight Corridor
+registration.register(
+    id="MiniHack-CorridorBattle-v0",
+    entry_point="nle.minihack.envs.fightcorridor:MiniHackFightCorridor",
+)
+registration.register(
+    id="MiniHack-CorridorBattle-Dark-v0",
+    entry_point="nle.minihack.envs.fightcorridor:MiniHackFightCorridorDark",
+)
+
+# MiniGrid
+registration.register(
+    id="MiniHack-MultiRoom-N2-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniHackMultiRoomN2",
+)
+registration.register(
+    id="MiniHack-MultiRoom-N4-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniHackMultiRoomN4",
+)
+registration.register(
+    id="MiniHack-MultiRoom-N6-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniHackMultiRoomN6",
+)
+registration.register(
+    id="MiniHack-LockedMultiRoom-N2-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniHackMultiRoomN2Locked",
+)
+registration.register(
+    id="MiniHack-LockedMultiRoom-N4-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniHackMultiRoomN4Locked",
+)
+registration.register(
+    id="MiniHack-LockedMultiRoom-N6-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniHackMultiRoomN6Locked",
+)
+registration.register(
+    id="MiniHack-LavaMultiRoom-N2-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniHackMultiRoomN2Lava",
+)
+registration.register(
+    id="MiniHack-LavaMultiRoom-N4-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniHackMultiRoomN4Lava",
+)
+registration.register(
+    id="MiniHack-LavaMultiRoom-N6-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniHackMultiRoomN6Lava",
+)
+
+# MiniGrid: MonsterMultiRoom
+registration.register(
+    id="MiniHack-MonsterMultiRoom-N2-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniHackMultiRoomN2Monster",
+)
+registration.register(
+    id="MiniHack-MonsterMultiRoom-N4-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniHackMultiRoomN4Monster",
+)
+registration.register(
+    id="MiniHack-MonsterMultiRoom-N6-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniHackMultiRoomN6Monster",
+)
+registration.register(
+    id="MiniHack-ExtremeMultiRoom-N2-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniHackMultiRoomN2Extreme",
+)
+registration.register(
+    id="MiniHack-ExtremeMultiRoom-N4-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniHackMultiRoomN4Extreme",
+)
+registration.register(
+    id="MiniHack-ExtremeMultiRoom-N6-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniHackMultiRoomN6Extreme",
+)
+
+# MiniGrid: LavaCrossing
+registration.register(
+    id="MiniHack-LavaCrossingS9N1-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniGridHack",
+    kwargs={"env_name": "MiniGrid-LavaCrossingS9N1-v0"},
+)
+registration.register(
+    id="MiniHack-LavaCrossingS9N2-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniGridHack",
+    kwargs={"env_name": "MiniGrid-LavaCrossingS9N2-v0"},
+)
+registration.register(
+    id="MiniHack-LavaCrossingS9N3-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniGridHack",
+    kwargs={"env_name": "MiniGrid-LavaCrossingS9N3-v0"},
+)
+registration.register(
+    id="MiniHack-LavaCrossingS11N5-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniGridHack",
+    kwargs={"env_name": "MiniGrid-LavaCrossingS11N5-v0"},
+)
+
+# MiniGrid: Simple Crossing
+registration.register(
+    id="MiniHack-SimpleCrossingS9N1-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniGridHack",
+    kwargs={"env_name": "MiniGrid-SimpleCrossingS9N1-v0"},
+)
+registration.register(
+    id="MiniHack-SimpleCrossingS9N2-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniGridHack",
+    kwargs={"env_name": "MiniGrid-SimpleCrossingS9N2-v0"},
+)
+registration.register(
+    id="MiniHack-SimpleCrossingS9N3-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniGridHack",
+    kwargs={"env_name": "MiniGrid-SimpleCrossingS9N3-v0"},
+)
+registration.register(
+    id="MiniHack-SimpleCrossingS11N5-v0",
+    entry_point="nle.minihack.envs.minigrid:MiniGridHack",
+    kwargs={"env_name": "MiniGrid-SimpleCrossingS11N5-v0"},
+)
+
+# Memento
+registration.register(
+    id="MiniHack-Memento-Short-F2-v0",
+    entry_point="nle.minihack.envs.memento:MiniHackMementoShortF2",
+)
+registration.register(
+    id="MiniHack-Memento-F2-v0",
+    entry_point="nle.minihack.envs.memento:MiniHackMementoF2",
+)
+registration.register(
+    id="MiniHack-Memento-F4-v0",
+    entry_point="nle.minihack.envs.memento:MiniHackMementoF4",
+)
+
+# Boxoban
+registration.register(
+    id="MiniHack-Boxoban-Unfiltered-v0",
+    entry_point="nle.minihack.envs.boxohack:MiniHackBoxobanUnfiltered",
+)
+registration.register(
+    id="MiniHack-Boxoban-Medium-v0",
+    entry_point="nle.minihack.envs.boxohack:MiniHackBoxobanMedium",
+)
+registration.register(
+    id="MiniHack-Boxoban-Hard-v0",
+    entry_point="nle.minihack.envs.boxohack:MiniHackBoxobanHard",
+)
+
+# River
+registration.register(
+    id="MiniHack-River-v0",
+    entry_point="nle.minihack.envs.river:MiniHackRiver",
+)
+registration.register(
+    id="MiniHack-River-Monster-v0",
+    entry_point="nle.minihack.envs.river:MiniHackRiverMonster",
+)
+registration.register(
+    id="MiniHack-River-Lava-v0",
+    entry_point="nle.minihack.envs.river:MiniHackRiverLava",
+)
+registration.register(
+    id="MiniHack-River-MonsterLava-v0",
+    entry_point="nle.minihack.envs.river:MiniHackRiverMonsterLava",
+)
+registration.register(
+    id="MiniHack-River-Narrow-v0",
+    entry_point="nle.minihack.envs.river:MiniHackRiverNarrow",
+)
+
+# HideNSeek
+registration.register(
+    id="MiniHack-HideNSeek-Mapped-v0",
+    entry_point="nle.minihack.envs.hidenseek:MiniHackHideAndSeekMapped",
+)
+registration.register(
+    id="MiniHack-HideNSeek-v0",
+    entry_point="nle.minihack.envs.hidenseek:MiniHackHideAndSeek",
+)
+registration.register(
+    id="MiniHack-HideNSeek-Lava-v0",
+    entry_point="nle.minihack.envs.hidenseek:MiniHackHideAndSeekLava",
+)
+registration.register(
+    id="MiniHack-HideNSeek-Big-v0",
+    entry_point="nle.minihack.envs.hidenseek:MiniHackHideAndSeekBig",
+)
+
+# Labyrinth
+registration.register(
+    id="MiniHack-Labyrinth-Big-v0",
+    entry_point="nle.minihack.envs.lab:MiniHackLabyrinth",
+)
+registration.register(
+    id="MiniHack-Labyrinth-Small-v0",
+    entry_point="nle.minihack.envs.lab:MiniHackLabyrinthSmall",
+)
+
+# Explore Maze
+registration.register(
+    id="MiniHack-ExploreMaze-Easy-v0",
+    entry_point="nle.minihack.envs.exploremaze:MiniHackExploreMazeEasy",
+)
+registration.register(
+    id="MiniHack-ExploreMaze-Hard-v0",
+    entry_point="nle.minihack.envs.exploremaze:MiniHackExploreMazeHard",
+)
+registration.register(
+    id="MiniHack-ExploreMaze-Easy-Mapped-v0",
+    entry_point="nle.minihack.envs.exploremaze:MiniHackExploreMazeEasyMapped",
+)
+registration.register(
+    id="MiniHack-ExploreMaze-Hard-Mapped-v0",
+    entry_point="nle.minihack.envs.exploremaze:MiniHackExploreMazeHardMapped",
+)
+
+# Skills: simple tasks
+
+# Tasks (w/o doors)
+registration.register(
+    id="MiniHack-Eat-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackEat",
+)
+registration.register(
+    id="MiniHack-Pray-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackPray",
+)
+registration.register(
+    id="MiniHack-Sink-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackSink",
+)
+registration.register(
+    id="MiniHack-Wield-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackWield",
+)
+registration.register(
+    id="MiniHack-Wear-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackWear",
+)
+registration.register(
+    id="MiniHack-PutOn-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackPutOn",
+)
+registration.register(
+    id="MiniHack-Zap-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackZap",
+)
+registration.register(
+    id="MiniHack-Read-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackRead",
+)
+
+# Fixed version of tasks
+registration.register(
+    id="MiniHack-Eat-Fixed-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackEatFixed",
+)
+registration.register(
+    id="MiniHack-Pray-Fixed-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackPrayFixed",
+)
+registration.register(
+    id="MiniHack-Sink-Fixed-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackSinkFixed",
+)
+registration.register(
+    id="MiniHack-Wield-Fixed-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackWieldFixed",
+)
+registration.register(
+    id="MiniHack-Wear-Fixed-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackWearFixed",
+)
+registration.register(
+    id="MiniHack-PutOn-Fixed-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackPutOnFixed",
+)
+registration.register(
+    id="MiniHack-Zap-Fixed-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackZapFixed",
+)
+registration.register(
+    id="MiniHack-Read-Fixed-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackReadFixed",
+)
+
+# Task versions with random distractions
+registration.register(
+    id="MiniHack-Eat-Distr-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackEatDistr",
+)
+registration.register(
+    id="MiniHack-Pray-Distr-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackPrayDistr",
+)
+registration.register(
+    id="MiniHack-Sink-Distr-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackSinkDistr",
+)
+registration.register(
+    id="MiniHack-Wield-Distr-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackWieldDistr",
+)
+registration.register(
+    id="MiniHack-Wear-Distr-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackWearDistr",
+)
+registration.register(
+    id="MiniHack-PutOn-Distr-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackPutOnDistr",
+)
+registration.register(
+    id="MiniHack-Zap-Distr-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackZapDistr",
+)
+registration.register(
+    id="MiniHack-Read-Distr-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackReadDistr",
+)
+
+# Tasks involvign doors
+registration.register(
+    id="MiniHack-ClosedDoor-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackClosedDoor",
+)
+registration.register(
+    id="MiniHack-LockedDoor-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackLockedDoor",
+)
+registration.register(
+    id="MiniHack-LockedDoor-Fixed-v0",
+    entry_point="nle.minihack.envs.skills_simple:MiniHackLockedDoorFixed",
+)
+
+# Skills: wand of death
+registration.register(
+    id="MiniHack-WoD-Easy-v0",
+    entry_point="nle.minihack.envs.skills_wod:MiniHackWoDEasy",
+)
+registration.register(
+    id="MiniHack-WoD-Medium-v0",
+    entry_point="nle.minihack.envs.skills_wod:MiniHackWoDMedium",
+)
+registration.register(
+    id="MiniHack-WoD-Hard-v0",
+    entry_point="nle.minihack.envs.skills_wod:MiniHackWoDHard",
+)
+registration.register(
+    id="MiniHack-WoD-Pro-v0",
+    entry_point="nle.minihack.envs.skills_wod:MiniHackWoDPro",
+)
+
+# Skills: levitation
+registration.register(
+    id="MiniHack-Levitate-Boots-v0",
+    entry_point="nle.minihack.envs.skills_levitate:MiniHackLevitateBoots",
+)
+registration.register(
+    id="MiniHack-Levitate-Ring-v0",
+    entry_point="nle.minihack.envs.skills_levitate:MiniHackLevitateRing",
+)
+registration.register(
+    id="MiniHack-Levitate-Potion-v0",
+    entry_point="nle.minihack.envs.skills_levitate:MiniHackLevitatePotion",
+)
+registration.register(
+    id="MiniHack-Levitate-Random-v0",
+    entry_point="nle.minihack.envs.skills_levitate:MiniHackLevitateRandom",
+)
+registration.register(
+    id="MiniHack-Levitate-Boots-Fixed-v0",
+    entry_point="nle.minihack.envs.skills_levitate:MiniHackLevitateBootsFixed",
+)
+registration.register(
+    id="MiniHack-Levitate-Ring-Fixed-v0",
+    entry_point="nle.minihack.envs.skills_levitate:MiniHackLevitateRingFixed",
+)
+registration.register(
+    id="MiniHack-Levitate-Potion-Fixed-v0",
+    entry_point="nle.minihack.envs.skills_levitate:MiniHackLevitatePotionFixed",
+)
+
+# Skills: freeze
+registration.register(
+    id="MiniHack-Freeze-Wand-v0",
+    entry_point="nle.minihack.envs.skills_freeze:MiniHackFreezeWand",
+)
+registration.register(
+    id="MiniHack-Freeze-Horn-v0",
+    entry_point="nle.minihack.envs.skills_freeze:MiniHackFreezeHorn",
+)
+registration.register(
+    id="MiniHack-Freeze-Random-v0",
+    entry_point="nle.minihack.envs.skills_freeze:MiniHackFreezeRandom",
+)
+registration.register(
+    id="MiniHack-Freeze-Lava-v0",
+    entry_point="nle.minihack.envs.skills_freeze:MiniHackFreezeLava",
+)
+
+# Skills: invisibility
+registration.register(
+    id="MiniHack-Invis-Potion-v0",
+    entry_point="nle.minihack.envs.skills_invis:MiniHackInvisPotion",
+)
+registration.register(
+    id="MiniHack-Invis-Ring-v0",
+    entry_point="nle.minihack.envs.skills_invis:MiniHackInvisRing",
+)
+registration.register(
+    id="MiniHack-Invis-Wand-v0",
+    entry_point="nle.minihack.envs.skills_invis:MiniHackInvisWand",
+)
+registration.register(
+    id="MiniHack-Invis-Cloak-v0",
+    entry_point="nle.minihack.envs.skills_invis:MiniHackInvisCloak",
+)
+registration.register(
+    id="MiniHack-Invis-Random-v0",
+    entry_point="nle.minihack.envs.skills_invis:MiniHackInvisRandom",
+)
+registration.register(
+    id="MiniHack-Invis-Random-Distract-v0",
+    entry_point="nle.minihack.envs.skills_invis:MiniHackInvisRandomDist",
+)
+
+# Skills: lava crossing
+registration.register(
+    id="MiniHack-LavaCross-Levitate-Potion-Pickup-v0",
+    entry_point="nle.minihack.envs.skills_lava:MiniHackLCLevitatePotionPickup",
+)
+registration.register(
+    id="MiniHack-LavaCross-Levitate-Potion-Inv-v0",
+    entry_point="nle.minihack.envs.skills_lava:MiniHackLCLevitatePotionInv",
+)
+registration.register(
+    id="MiniHack-LavaCross-Levitate-Ring-Pickup-v0",
+    entry_point="nle.minihack.envs.skills_lava:MiniHackLCLevitateRingPickup",
+)
+registration.register(
+    id="MiniHack-LavaCross-Levitate-Ring-Inv-v0",
+    entry_point="nle.minihack.envs.skills_lava:MiniHackLCLevitateRingInv",
+)
+registration.register(
+    id="MiniHack-LavaCross-Levitate-v0",
+    entry_point="nle.minihack.envs.skills_lava:MiniHackLCLevitate",
+)
+registration.register(
+    id="MiniHack-LavaCross-v0",
+    entry_point="nle.minihack.envs.skills_lava:MiniHackLC",
+)
+
+# Skills: chest
+registration.register(
+    id="MiniHack-Unlock-v0",
+    entry_point="nle.minihack.envs.skills_chest:MiniHackUnlock",
+)
+registration.register(
+    id="MiniHack-UnlockLoot-v0",
+    entry_point="nle.minihack.envs.skills_chest:MiniHackUnlockLoot",
+)
+registration.register(
+    id="MiniHack-UnlockEat-v0",
+    entry_point="nle.minihack.envs.skills_chest:MiniHackUnlockEat",
+)
+
+# Skills: quest
+registration.register(
+    id="MiniHack-Quest-Easy-v0",
+    entry_point="nle.minihack.envs.skills_quest:MiniHackQuestEasy",
+)
+registration.register(
+    id="MiniHack-Quest-Medium-v0",
+    entry_point="nle.minihack.envs.skills_quest:MiniHackQuestMedium",
+)
+registration.register(
+    id="MiniHack-Quest-Hard-v0",
+    entry_point="nle.minihack.envs.skills_quest:MiniHackQuestHard",
+)
+
+# memory
+registration.register(
+    id="MiniHack-Memory-v0",
+    entry_point="nle.minihack.envs.memory:MiniHackMemory",
+)
@@ -1,7 +1,12 @@
 # Copyright (c) Facebook, Inc. and its affiliates.
 
+import enum
+import functools
+import hashlib
 import os
+import shutil
 import subprocess
+import tempfile
 
 import gym
 import numpy as np
@@ -9,8 +14,10 @@ import pkg_resources
 from nle import _pynethack, nethack
 from nle.env.base import FULL_ACTIONS, NLE_SPACE_ITEMS
 from nle.env.tasks import NetHackStaircase
+from nle.minihack import _fast
 from nle.minihack.wiki import NetHackWiki
 from nle.tiles import GlyphMapper
+from nle.version import __version__ as nle_version
 
 PATH_DAT_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "dat")
 LIB_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "lib")
@@ -24,6 +31,19 @@ MH_FULL_ACTIONS = list(FULL_ACTIONS)
 MH_FULL_ACTIONS.remove(nethack.MiscDirection.UP)
 MH_FULL_ACTIONS = tuple(MH_FULL_ACTIONS)
 
+# Directions to the 9 tiles around the agent, row by row (None for agent's tile)
+INDEX_TO_DIR_ACTION = (
+    ord("y"),
+    ord("k"),
+    ord("u"),
+    ord("h"),
+    None,
+    ord("l"),
+    ord("b"),
+    ord("j"),
+    ord("n"),
+)
+
 RGB_MAX_VAL = 255
 N_TILE_PIXEL = 16
 
@@ -59,6 +79,65 @@ MINIHACK_SPACE_FUNCS = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _get_glyph_mapper():
+    """Returns the glyph mapper shared by all environments of the process."""
+    return GlyphMapper()
+
+
+def _descriptions_to_bytes(descriptions):
+    """Views an array of screen descriptions as a flat array of fixed-length
+    byte strings, one per tile (with the null padding stripped on access)."""
+    length = descriptions.shape[-1]
+    return descriptions.reshape(-1, length).view(f"S{length}").ravel()
+
+
+def _nhdat_cache_dir():
+    """Returns the per-user directory of cached nhdat files, or None if it
+    can't be created."""
+    cache_home = os.environ.get(
+        "XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")
+    )
+    cache_dir = os.path.join(cache_home, "minihack", "nhdat")
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    except OSError:
+        return None
+    return cache_dir
+
+
+def _nhdat_cache_path(des_path):
+    """Returns the path of the cached nhdat compiled from the given
+    description file, or None if nhdat files can't be cached."""
+    cache_dir = _nhdat_cache_dir()
+    if cache_dir is None:
+        return None
+    with open(des_path, "rb") as f:
+        des_hash = hashlib.blake2b(f.read())
+    # Invalidate the cache whenever the library or NetHack changes
+    des_hash.update(nle_version.encode())
+    for name in sorted(os.listdir(LIB_DIR)):
+        with open(os.path.join(LIB_DIR, name), "rb") as f:
+            des_hash.update(name.encode())
+            des_hash.update(f.read())
+    for tool in ("lev_comp", "dlb"):
+        tool_path = os.path.join(nethack.HACKDIR, tool)
+        des_hash.update(tool_path.encode())
+        if os.path.exists(tool_path):
+            des_hash.update(str(os.path.getmtime(tool_path)).encode())
+    return os.path.join(cache_dir, des_hash.hexdigest()[:16])
+
+
+class ObsKind(enum.IntEnum):
+    """How an entry of the observation plan is computed."""
+
+    RAW = 0
+    CROP = 1  # cropped around the agent
+    CROP_TTY = 2  # cropped around the tty cursor
+    PIXEL = 3
+    PIXEL_CROP = 4
+
+
 class MiniHack(NetHackStaircase):
     """Base class for custom MiniHack environments.
 
@@ -68,6 +147,8 @@ class MiniHack(NetHackStaircase):
     - Wizard mode is turned off by default
     - One-letter menu questions are allowed by default
     - Includes all NLE observations
+    - Observations are returned as a dict, or as a tuple ordered like
+    observation_keys if flat_obs is set
 
     The goal is to reach the staircase.
 
@@ -95,6 +176,7 @@ class MiniHack(NetHackStaircase):
         obs_crop_pad=0,
         reward_manager=None,
         use_wiki=False,
+        flat_obs=False,
         **kwargs,
     ):
         # No pet
@@ -117,7 +199,7 @@ class MiniHack(NetHackStaircase):
         )
         # Handle RGB pixel observations
         if any("pixel" in key for key in self._minihack_obs_keys):
-            self._glyph_mapper = GlyphMapper()
+            self._glyph_mapper = _get_glyph_mapper()
             if "pixel_crop" in self._minihack_obs_keys:
                 # Make sure glyphs_crop and chars_crop are there
                 for key in ("glyphs_crop", "chars_crop"):
@@ -133,22 +215,63 @@ class MiniHack(NetHackStaircase):
         # Patch the nhdat library by compling the given .des file
         self.update(des_file)
 
+        self._previous_obs_keys = self._get_previous_obs_keys()
+
         self.obs_crop_h = obs_crop_h
         self.obs_crop_w = obs_crop_w
         self.obs_crop_pad = obs_crop_pad
 
         assert self.obs_crop_h % 2 == 1
         assert self.obs_crop_w % 2 == 1
+        # Half-sizes of the crop window around its center
+        self._dh = self.obs_crop_h // 2
+        self._dw = self.obs_crop_w // 2
+        # Use the numba kernel for cropping if numba is installed
+        self._crop_kernel = _fast.get_crop_observation()
+        if self._crop_kernel is not None:
+            self._crop_observation = self._crop_observation_numba
 
         self.reward_win = reward_win
         self.reward_lose = reward_lose
 
         self._scr_descr_index = self._observation_keys.index("screen_descriptions")
-        self.observation_space = gym.spaces.Dict(self.get_obs_space_dict(space_dict))
+        # Inventory observations are optional, -1 marks them as unavailable
+        self._inv_strs_index = (
+            self._observation_keys.index("inv_strs")
+            if "inv_strs" in self._observation_keys
+            else -1
+        )
+        self._inv_letters_index = (
+            self._observation_keys.index("inv_letters")
+            if "inv_letters" in self._observation_keys
+            else -1
+        )
+        obs_space_dict = self.get_obs_space_dict(space_dict)
+        self._flat_obs = flat_obs
+        if self._flat_obs:
+            self.observation_space = gym.spaces.Tuple(
+                [obs_space_dict[key] for key in self._minihack_obs_keys]
+            )
+        else:
+            self.observation_space = gym.spaces.Dict(obs_space_dict)
+
+        # Cropped observations are written into preallocated buffers
+        self._crop_bufs = {
+            key: np.full(space.shape, self.obs_crop_pad, dtype=space.dtype)
+            for key, space in obs_space_dict.items()
+            if key in MINIHACK_SPACE_FUNCS.keys() and "pixel" not in key
+        }
+        self._tty_cursor_index = self._observation_keys.index("tty_cursor")
+        self._chars_index = self._observation_keys.index("chars")
+        self._obs_plan = self._get_obs_plan()
 
         self.use_wiki = use_wiki
         if self.use_wiki:
             self.wiki = NetHackWiki()
+            # Most neighboring descriptions repeat every step (walls, floor)
+            self._wiki_lookup = functools.lru_cache(maxsize=4096)(
+                self.wiki.get_page_text
+            )
 
     def get_obs_space_dict(self, space_dict):
         obs_space_dict = {}
@@ -173,9 +296,60 @@ class MiniHack(NetHackStaircase):
 
         return obs_space_dict
 
+    def _get_obs_plan(self):
+        """Returns a tuple of (position, kind, source index, crop buffer)
+        entries describing how each observation is computed, so that no key
+        lookups are needed in _get_observation. The position is the index of
+        the observation in self._minihack_obs_keys."""
+        positions = {key: i for i, key in enumerate(self._minihack_obs_keys)}
+        self._pixel_pos = positions.get("pixel", -1)
+        self._glyphs_crop_pos = positions.get("glyphs_crop", -1)
+        self._chars_crop_pos = positions.get("chars_crop", -1)
+
+        plan = []
+        pixel_plan = []
+        for pos, key in enumerate(self._minihack_obs_keys):
+            if key == "pixel":
+                pixel_plan.insert(0, (pos, ObsKind.PIXEL, self._glyph_index, None))
+            elif key == "pixel_crop":
+                pixel_plan.append((pos, ObsKind.PIXEL_CROP, -1, None))
+            elif key in self._observation_keys:
+                index = self._observation_keys.index(key)
+                plan.append((pos, ObsKind.RAW, index, None))
+            elif key in self._crop_bufs:
+                orig_key = key.replace("_crop", "")
+                kind = ObsKind.CROP_TTY if "tty" in orig_key else ObsKind.CROP
+                index = self._observation_keys.index(orig_key)
+                plan.append((pos, kind, index, self._crop_bufs[key]))
+        # Pixel observations depend on the others, and pixel_crop on pixel
+        return tuple(plan + pixel_plan)
+
+    def _set_crop_bufs(self, crop_bufs):
+        """Replaces the buffers the given cropped observations are written
+        into, e.g. with views of a buffer batching several environments."""
+        self._crop_bufs.update(crop_bufs)
+        self._obs_plan = self._get_obs_plan()
+
+    def _get_previous_obs_keys(self):
+        """Returns the (key, index) pairs of the observations the reward
+        manager reads from the previous observation."""
+        if self.reward_manager is None:
+            return ()
+        keys = self.reward_manager.required_obs_keys()
+        if keys is None:
+            keys = self._observation_keys
+        unknown = set(keys) - set(self._observation_keys)
+        if unknown:
+            raise ValueError(
+                f"The reward manager requires unavailable observations {unknown}"
+            )
+        return tuple((key, self._observation_keys.index(key)) for key in keys)
+
     def reset(self, *args, **kwargs):
         if self.reward_manager is not None:
             self.reward_manager.reset()
+            # Events may have been added since the last episode
+            self._previous_obs_keys = self._get_previous_obs_keys()
         return super().reset(*args, **kwargs)
 
     def _reward_fn(self, last_observation, observation, end_status):
@@ -193,7 +367,13 @@ class MiniHack(NetHackStaircase):
         return reward + self._get_time_penalty(last_observation, observation)
 
     def step(self, action: int):
-        self._previous_obs = tuple(a.copy() for a in self.last_observation)
+        # The previous observation is only consumed by the reward manager,
+        # so only copy the parts of it that it needs
+        if self.reward_manager is not None:
+            self._previous_obs = {
+                key: self.last_observation[index].copy()
+                for key, index in self._previous_obs_keys
+            }
         self._previous_action = action
         # Within this call, _is_episode_end is called and then _reward_fn,
         # both using self.reward_manager
@@ -221,81 +401,138 @@ class MiniHack(NetHackStaircase):
         description file and replacing the new nhdat file in the temporary
         hackdir directory of the environment.
         """
-        if not des_file.endswith(".des"):
-            fpath = os.path.join(self.env._vardir, "mylevel.des")
-            # If the des-file is passed as a string
-            with open(fpath, "w") as f:
-                f.writelines(des_file)
-            des_file = fpath
-
-        # Use the .des file if exists, otherwise search in minihack directory
-        des_path = os.path.abspath(des_file)
-        if not os.path.exists(des_path):
-            des_path = os.path.abspath(os.path.join(PATH_DAT_DIR, des_file))
-        if not os.path.exists(des_path):
-            print(
-                "{} file doesn't exist. Please provide a path to a valid .des \
-                    file".format(
-                    des_path
+        cache_path = None
+        if des_file.endswith(".des"):
+            # Use the .des file if exists, otherwise search in minihack directory
+            des_path = os.path.abspath(des_file)
+            if not os.path.exists(des_path):
+                des_path = os.path.abspath(os.path.join(PATH_DAT_DIR, des_file))
+            if not os.path.exists(des_path):
+                print(
+                    "{} file doesn't exist. Please provide a path to a valid .des \
+                        file".format(
+                        des_path
+                    )
                 )
-            )
+            else:
+                # Only des-files given by path are cached, as des-file strings
+                # are often randomly generated on every reset
+                cache_path = _nhdat_cache_path(des_path)
+            des_input = None
+        else:
+            # If the des-file is passed as a string, pipe it to the script
+            des_path = "-"
+            des_input = des_file.encode("utf-8")
+
+        nhdat_path = os.path.join(self.env._vardir, "nhdat")
+        if cache_path is not None and os.path.exists(cache_path):
+            # The same des-file was already compiled by another environment
+            shutil.copy(cache_path, nhdat_path)
+            return
+
         try:
-            _ = subprocess.call(
+            subprocess.run(
                 [
                     PATCH_SCRIPT,
                     self.env._vardir,
                     nethack.HACKDIR,
                     LIB_DIR,
                     des_path,
-                ]
+                ],
+                input=des_input,
+                check=True,
             )
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Couldn't patch the nhdat file.\n{e}")
 
+        if cache_path is not None:
+            # Copy then rename so that concurrent environments never read a
+            # partially written cache file. Caching is best effort, as the
+            # nhdat file is already in place
+            tmp_path = None
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path))
+                os.close(fd)
+                shutil.copy(nhdat_path, tmp_path)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+
     def _get_observation(self, observation):
         # Filter out observations that we don't need
-        observation = super()._get_observation(observation)
-        obs_dict = {}
-        for key in self._minihack_obs_keys:
-            if "pixel" in key:
-                continue
-            if key in self._observation_keys:
-                obs_dict[key] = observation[key]
-            elif key in MINIHACK_SPACE_FUNCS.keys():
-                orig_key = key.replace("_crop", "")
-                if "tty" in orig_key:
-                    loc = observation["tty_cursor"][::-1]
-                else:
-                    loc = observation["blstats"][:2]
-                obs_dict[key] = self._crop_observation(observation[orig_key], loc)
-
-        if "pixel" in self._minihack_obs_keys:
-            obs_dict["pixel"] = self._glyph_mapper.to_rgb(
-                observation["glyphs"], observation["chars"]
-            )
+        loc = observation[self._blstats_index][:2]
+        obs = [None] * len(self._minihack_obs_keys)
+        for pos, kind, index, buf in self._obs_plan:
+            if kind == ObsKind.RAW:
+                obs[pos] = observation[index]
+            elif kind == ObsKind.CROP:
+                obs[pos] = self._crop_observation(observation[index], loc, buf)
+            elif kind == ObsKind.CROP_TTY:
+                tty_loc = observation[self._tty_cursor_index][::-1]
+                obs[pos] = self._crop_observation(observation[index], tty_loc, buf)
+            elif kind == ObsKind.PIXEL:
+                obs[pos] = self._glyph_mapper.to_rgb(
+                    observation[index], observation[self._chars_index]
+                )
+            elif kind == ObsKind.PIXEL_CROP:
+                pixel_crop = None
+                if self._pixel_pos >= 0:
+                    pixel_crop = self._slice_pixel_crop(obs[self._pixel_pos], loc)
+                if pixel_crop is None:
+                    pixel_crop = self._glyph_mapper.to_rgb(
+                        obs[self._glyphs_crop_pos], obs[self._chars_crop_pos]
+                    )
+                obs[pos] = pixel_crop
+
+        if self._flat_obs:
+            return tuple(obs)
+        return dict(zip(self._minihack_obs_keys, obs))
+
+    def _slice_pixel_crop(self, pixel, loc):
+        """Returns the pixel crop around loc as a slice of the full pixel
+        observation, or None if the crop window exceeds the map (as the
+        padded tiles then have to be rendered)."""
+        dh, dw = self._dh, self._dw
+        h, w = pixel.shape[0] // N_TILE_PIXEL, pixel.shape[1] // N_TILE_PIXEL
+
+        x, y = int(loc[0]), int(loc[1])
+        if x - dw < 0 or x + dw >= w or y - dh < 0 or y + dh >= h:
+            return None
+
+        y0, x0 = (y - dh) * N_TILE_PIXEL, (x - dw) * N_TILE_PIXEL
+        return pixel[
+            y0 : y0 + self.obs_crop_h * N_TILE_PIXEL,
+            x0 : x0 + self.obs_crop_w * N_TILE_PIXEL,
+        ]
 
-        if "pixel_crop" in self._minihack_obs_keys:
-            obs_dict["pixel_crop"] = self._glyph_mapper.to_rgb(
-                obs_dict["glyphs_crop"], obs_dict["chars_crop"]
+    def _crop_observation(self, obs, loc, buf):
+        """Crops obs around loc into buf, padding outside of the map with
+        obs_crop_pad, and returns buf."""
+        dh, dw = self._dh, self._dw
+        h, w = obs.shape[:2]
+
+        # Cast to int as e.g. tty_cursor is unsigned
+        x, y = int(loc[0]), int(loc[1])
+
+        # Intersection of the crop window with the map
+        syt, syb = max(y - dh, 0), min(y + dh + 1, h)
+        sxl, sxr = max(x - dw, 0), min(x + dw + 1, w)
+        dyt, dxl = syt - (y - dh), sxl - (x - dw)
+
+        buf.fill(self.obs_crop_pad)
+        if syt < syb and sxl < sxr:
+            np.copyto(
+                buf[dyt : dyt + syb - syt, dxl : dxl + sxr - sxl],
+                obs[syt:syb, sxl:sxr],
             )
+        return buf
 
-        return obs_dict
-
-    def _crop_observation(self, obs, loc):
-        dh = self.obs_crop_h // 2
-        dw = self.obs_crop_w // 2
-
-        (x, y) = loc
-        x += dw
-        y += dh
-
-        obs = np.pad(
-            obs,
-            pad_width=(dw, dh),
-            mode="constant",
-            constant_values=self.obs_crop_pad,
+    def _crop_observation_numba(self, obs, loc, buf):
+        """Same as _crop_observation, using the numba kernel."""
+        return self._crop_kernel(
+            obs, int(loc[0]), int(loc[1]), self._dh, self._dw, self.obs_crop_pad, buf
         )
-        return obs[y - dh : y + dh + 1, x - dw : x + dw + 1]
 
     def _no_rand_mon(self):
         os.environ["NH_NO_RAND_MON"] = "1"
@@ -309,20 +546,18 @@ class MiniHack(NetHackStaircase):
             the key of the first item in the inventory that includes the
             argument name as a substring
         """
-        assert "inv_strs" in self._observation_keys
-        assert "inv_letters" in self._observation_keys
+        assert self._inv_strs_index >= 0 and self._inv_letters_index >= 0
 
-        inv_strs_index = self._observation_keys.index("inv_strs")
-        inv_letters_index = self._observation_keys.index("inv_letters")
-
-        inv_strs = self.last_observation[inv_strs_index]
-        inv_letters = self.last_observation[inv_letters_index]
+        inv_strs = self.last_observation[self._inv_strs_index]
+        inv_letters = self.last_observation[self._inv_letters_index]
 
+        needle = name.encode("utf-8")
         for letter, line in zip(inv_letters, inv_strs):
-            if np.all(line == 0):
+            line_bytes = line.tobytes()
+            if line_bytes[0] == 0:
                 break
-            if name in line.tobytes().decode("utf-8"):
-                return letter.tobytes().decode("utf-8")
+            if needle in line_bytes:
+                return chr(letter)
 
         return None
 
@@ -332,18 +567,7 @@ class MiniHack(NetHackStaircase):
         position).
         """
         assert 0 <= index < 9
-        index_to_dir_dict = {
-            0: ord("y"),
-            1: ord("k"),
-            2: ord("u"),
-            3: ord("h"),
-            4: None,
-            5: ord("l"),
-            6: ord("b"),
-            7: ord("j"),
-            8: ord("n"),
-        }
-        return index_to_dir_dict[index]
+        return INDEX_TO_DIR_ACTION[index]
 
     def get_direction_obj(self, name, observation=None):
         """Find the game direction of the (first) object in neighboring nine
@@ -364,14 +588,22 @@ class MiniHack(NetHackStaircase):
         if observation is None:
             observation = self.last_observation
         blstats = observation[self._blstats_index]
-        x, y = blstats[:2]
-
-        neighbors = [
-            self.get_screen_description(i, j, observation)
-            for j in range(y - 1, y + 2)
-            for i in range(x - 1, x + 2)
+        x, y = int(blstats[0]), int(blstats[1])
+
+        descriptions = observation[self._scr_descr_index]
+        h, w, length = descriptions.shape
+        # Tiles beyond the map edges get an empty description, so that the
+        # result always has 9 entries in row-major order
+        block = np.zeros((3, 3, length), dtype=descriptions.dtype)
+        syt, syb = max(y - 1, 0), min(y + 2, h)
+        sxl, sxr = max(x - 1, 0), min(x + 2, w)
+        block[syt - y + 1 : syb - y + 1, sxl - x + 1 : sxr - x + 1] = descriptions[
+            syt:syb, sxl:sxr
+        ]
+        return [
+            row.tobytes().split(b"\x00", 1)[0].decode("utf-8", "replace")
+            for row in block.reshape(9, -1)
         ]
-        return neighbors
 
     def get_neighbor_wiki_pages(self, observation=None):
         if not self.use_wiki:
@@ -381,8 +613,7 @@ class MiniHack(NetHackStaircase):
             )
         neighbors_descriptions = self.get_neighbor_descriptions(observation)
         neighbor_pages = [
-            self.wiki.get_page_text(description)
-            for description in neighbors_descriptions
+            self._wiki_lookup(description) for description in neighbors_descriptions
         ]
         return neighbor_pages
 
@@ -391,10 +622,9 @@ class MiniHack(NetHackStaircase):
         if observation is None:
             observation = self.last_observation
 
-        des_arr = observation[self._scr_descr_index][y, x]
-        symb_len = np.where(des_arr == 0)[0][0]
-
-        return des_arr[:symb_len].tobytes().decode("utf-8")
+        des_bytes = observation[self._scr_descr_index][y, x].tobytes()
+        # Descriptions are null-terminated (unless they fill the whole row)
+        return des_bytes.split(b"\x00", 1)[0].decode("utf-8")
 
     def get_screen_wiki_page(self, x, y, observation=None):
         """Returns the wiki page matching the object on (x,y) coordinates."""
@@ -404,7 +634,7 @@ class MiniHack(NetHackStaircase):
                 "use_wiki=True to use the wiki"
             )
         description = self.get_screen_description(x, y, observation)
-        return self.wiki.get_page_text(description)
+        return self._wiki_lookup(description)
 
     def screen_contains(self, name, observation=None):
         """Whether the given name is included in screen descriptions of
@@ -413,11 +643,13 @@ class MiniHack(NetHackStaircase):
         if observation is None:
             observation = self.last_observation
 
-        y, x = nethack.SCREEN_DESCRIPTIONS_SHAPE[0:2]
-        for j in range(y):
-            for i in range(x):
-                des_arr = observation[self._scr_descr_index][j, i]
-                symb_len = np.where(des_arr == 0)[0][0]
-                if name in des_arr[:symb_len].tobytes().decode("utf-8"):
-                    return True
-        return False
+        descriptions = observation[self._scr_descr_index]
+        needle = name.encode("utf-8")
+        # Fast path: a single substring search over the whole contiguous block
+        if needle not in descriptions.tobytes():
+            return False
+
+        # A match could straddle two adjacent descriptions, so confirm it
+        # on a per-description basis
+        descriptions = _descriptions_to_bytes(descriptions)
+        return bool((np.char.find(descriptions, needle) >= 0).any())
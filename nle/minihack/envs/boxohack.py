@@ -5,7 +5,6 @@ import random
 import numpy as np
 import pkg_resources
 from nle import nethack
-from gym.envs import registration
 from nle.minihack import LevelGenerator, MiniHackNavigation
 
 LEVELS_PATH = os.path.join(
@@ -143,17 +142,3 @@ class MiniHackBoxobanHard(BoxoHack):
         kwargs["reward_shaping_coefficient"] = 0.1
         kwargs["penalty_time"] = -0.001
         super().__init__(*args, **kwargs)
-
-
-registration.register(
-    id="MiniHack-Boxoban-Unfiltered-v0",
-    entry_point="minihack.envs.boxohack:MiniHackBoxobanUnfiltered",
-)
-registration.register(
-    id="MiniHack-Boxoban-Medium-v0",
-    entry_point="minihack.envs.boxohack:MiniHackBoxobanMedium",
-)
-registration.register(
-    id="MiniHack-Boxoban-Hard-v0",
-    entry_point="minihack.envs.boxohack:MiniHackBoxobanHard",
-)
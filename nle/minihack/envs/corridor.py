@@ -1,6 +1,5 @@
 # Copyright (c) Facebook, Inc. and its affiliates.
 from nle.minihack import MiniHackNavigation
-from gym.envs import registration
 from nle.nethack import Command
 from nle import nethack
 
@@ -36,17 +35,3 @@ class MiniHackCorridor3(MiniHackCorridor):
 class MiniHackCorridor5(MiniHackCorridor):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, des_file="corridor5.des", **kwargs)
-
-
-registration.register(
-    id="MiniHack-Corridor-R2-v0",
-    entry_point="nle.minihack.envs.corridor:MiniHackCorridor2",
-)
-registration.register(
-    id="MiniHack-Corridor-R3-v0",
-    entry_point="nle.minihack.envs.corridor:MiniHackCorridor3",
-)
-registration.register(
-    id="MiniHack-Corridor-R5-v0",
-    entry_point="nle.minihack.envs.corridor:MiniHackCorridor5",
-)
@@ -1,4 +1,3 @@
-from gym.envs import registration
 from nle.minihack import MiniHackNavigation
 from nle.minihack.envs.corridor import NAVIGATE_ACTIONS
 from nle.minihack.reward_manager import RewardManager
@@ -34,7 +33,9 @@ class MiniHackExploreMaze(MiniHackNavigation):
         reward_manager.add_message_event(
             ["Mission Complete."], terminal_required=True, terminal_sufficient=True
         )
-        reward_manager.add_custom_reward_fn(stairs_reward_function)
+        reward_manager.add_custom_reward_fn(
+            stairs_reward_function, required_obs_keys=[]
+        )
         super().__init__(
             *args,
             des_file=des_file,
@@ -61,21 +62,3 @@ class MiniHackExploreMazeEasyMapped(MiniHackExploreMaze):
 class MiniHackExploreMazeHardMapped(MiniHackExploreMaze):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, des_file="exploremazehard_premapped.des", **kwargs)
-
-
-registration.register(
-    id="MiniHack-ExploreMaze-Easy-v0",
-    entry_point="nle.minihack.envs.exploremaze:MiniHackExploreMazeEasy",
-)
-registration.register(
-    id="MiniHack-ExploreMaze-Hard-v0",
-    entry_point="nle.minihack.envs.exploremaze:MiniHackExploreMazeHard",
-)
-registration.register(
-    id="MiniHack-ExploreMaze-Easy-Mapped-v0",
-    entry_point="nle.minihack.envs.exploremaze:MiniHackExploreMazeEasyMapped",
-)
-registration.register(
-    id="MiniHack-ExploreMaze-Hard-Mapped-v0",
-    entry_point="nle.minihack.envs.exploremaze:MiniHackExploreMazeHardMapped",
-)
@@ -1,5 +1,4 @@
 from nle.minihack import MiniHackNavigation, LevelGenerator
-from gym.envs import registration
 
 
 class MiniHackFightCorridor(MiniHackNavigation):
@@ -30,14 +29,3 @@ class MiniHackFightCorridor(MiniHackNavigation):
 class MiniHackFightCorridorDark(MiniHackFightCorridor):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, lit=False, **kwargs)
-
-
-registration.register(
-    id="MiniHack-CorridorBattle-v0",
-    entry_point="nle.minihack.envs.fightcorridor:MiniHackFightCorridor",
-)
-
-registration.register(
-    id="MiniHack-CorridorBattle-Dark-v0",
-    entry_point="nle.minihack.envs.fightcorridor:MiniHackFightCorridorDark",
-)
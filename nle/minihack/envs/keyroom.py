@@ -1,6 +1,5 @@
 from nle.minihack import MiniHackNavigation
 from nle.minihack.level_generator import KeyRoomGenerator
-from gym.envs import registration
 from nle.nethack import Command
 from nle import nethack
 
@@ -79,25 +78,3 @@ class MiniHackKeyRoom15x15Dark(MiniHackKeyRoom):
     def __init__(self, *args, **kwargs):
         kwargs["max_episode_steps"] = kwargs.pop("max_episode_steps", 400)
         super().__init__(*args, room_size=15, subroom_size=5, lit=False, **kwargs)
-
-
-registration.register(
-    id="MiniHack-KeyRoom-Fixed-S5-v0",
-    entry_point="nle.minihack.envs.keyroom:MiniHackKeyRoom5x5Fixed",
-)
-registration.register(
-    id="MiniHack-KeyRoom-S5-v0",
-    entry_point="nle.minihack.envs.keyroom:MiniHackKeyRoom5x5",
-)
-registration.register(
-    id="MiniHack-KeyRoom-S15-v0",
-    entry_point="nle.minihack.envs.keyroom:MiniHackKeyRoom15x15",
-)
-registration.register(
-    id="MiniHack-KeyRoom-Unlit-S5-v0",
-    entry_point="nle.minihack.envs.keyroom:MiniHackKeyRoom5x5Dark",
-)
-registration.register(
-    id="MiniHack-KeyRoom-Unlit-S15-v0",
-    entry_point="nle.minihack.envs.keyroom:MiniHackKeyRoom15x15Dark",
-)
@@ -1,5 +1,4 @@
 from nle.minihack import MiniHackNavigation, LevelGenerator
-from gym.envs import registration
 
 
 class MiniHackLabyrinth(MiniHackNavigation):
@@ -68,14 +67,3 @@ class MiniHackLabyrinthSmall(MiniHackNavigation):
             des_file=des_file,
             **kwargs,
         )
-
-
-registration.register(
-    id="MiniHack-Labyrinth-Big-v0",
-    entry_point="nle.minihack.envs.lab:MiniHackLabyrinth",
-)
-
-registration.register(
-    id="MiniHack-Labyrinth-Small-v0",
-    entry_point="nle.minihack.envs.lab:MiniHackLabyrinthSmall",
-)
@@ -1,7 +1,6 @@
 # Copyright (c) Facebook, Inc. and its affiliates.
 from nle.minihack import MiniHackNavigation
 from nle.minihack.level_generator import LevelGenerator
-from gym.envs import registration
 
 DUNGEON_SHAPE = (76, 21)
 
@@ -61,29 +60,3 @@ class MiniHackMazeWalk45x19(MiniHackMazeWalk):
 class MiniHackMazeWalk45x19Premapped(MiniHackMazeWalk):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, w=45, h=19, premapped=True, **kwargs)
-
-
-registration.register(
-    id="MiniHack-MazeWalk-9x9-v0",
-    entry_point="minihack.envs.mazewalk:MiniHackMazeWalk9x9",
-)
-registration.register(
-    id="MiniHack-MazeWalk-Premapped-9x9-v0",
-    entry_point="minihack.envs.mazewalk:MiniHackMazeWalk9x9Premapped",
-)
-registration.register(
-    id="MiniHack-MazeWalk-15x15-v0",
-    entry_point="minihack.envs.mazewalk:MiniHackMazeWalk15x15",
-)
-registration.register(
-    id="MiniHack-MazeWalk-Premapped-15x15-v0",
-    entry_point="minihack.envs.mazewalk:MiniHackMazeWalk15x15Premapped",
-)
-registration.register(
-    id="MiniHack-MazeWalk-45x19-v0",
-    entry_point="minihack.envs.mazewalk:MiniHackMazeWalk45x19",
-)
-registration.register(
-    id="MiniHack-MazeWalk-Premapped-45x19-v0",
-    entry_point="minihack.envs.mazewalk:MiniHackMazeWalk45x19Premapped",
-)
@@ -1,4 +1,3 @@
-from gym.envs import registration
 from nle.minihack import MiniHackNavigation, RewardManager
 
 
@@ -32,20 +31,3 @@ class MiniHackMementoF2(MiniHackMemento):
 class MiniHackMementoF4(MiniHackMemento):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, des_file="memento_hard.des", **kwargs)
-
-
-registration.register(
-    id="MiniHack-Memento-Short-F2-v0",
-    entry_point="nle.minihack.envs.memento:MiniHackMementoShortF2",
-)
-
-
-registration.register(
-    id="MiniHack-Memento-F2-v0",
-    entry_point="nle.minihack.envs.memento:MiniHackMementoF2",
-)
-
-registration.register(
-    id="MiniHack-Memento-F4-v0",
-    entry_point="nle.minihack.envs.memento:MiniHackMementoF4",
-)
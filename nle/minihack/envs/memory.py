@@ -1,5 +1,4 @@
 from nle.minihack import MiniHackNavigation, RewardManager
-from gym.envs import registration
 
 
 class MiniHackMemory(MiniHackNavigation):
@@ -17,9 +16,3 @@ class MiniHackMemory(MiniHackNavigation):
         super().__init__(
             *args, des_file="memory.des", reward_manager=reward_manager, **kwargs
         )
-
-
-registration.register(
-    id="MiniHack-Memory-v0",
-    entry_point="nle.minihack.envs.memory:MiniHackMemory",
-)
@@ -1,7 +1,6 @@
 # Copyright (c) Facebook, Inc. and its affiliates.
 from nle.minihack import MiniHackNavigation, LevelGenerator
 from nle.nethack import Command, CompassDirection
-from gym.envs import registration
 import gym
 
 
@@ -126,20 +125,6 @@ class MiniHackMultiRoomN6(MiniGridHack):
         super().__init__(*args, env_name="MiniGrid-MultiRoom-N6-v0", **kwargs)
 
 
-registration.register(
-    id="MiniHack-MultiRoom-N2-v0",
-    entry_point="minihack.envs.minigrid:MiniHackMultiRoomN2",
-)
-registration.register(
-    id="MiniHack-MultiRoom-N4-v0",
-    entry_point="minihack.envs.minigrid:MiniHackMultiRoomN4",
-)
-registration.register(
-    id="MiniHack-MultiRoom-N6-v0",
-    entry_point="minihack.envs.minigrid:MiniHackMultiRoomN6",
-)
-
-
 # MiniGrid: LockedMultiRoom
 class MiniHackMultiRoomN2Locked(MiniGridHack):
     def __init__(self, *args, **kwargs):
@@ -162,20 +147,6 @@ class MiniHackMultiRoomN6Locked(MiniGridHack):
         super().__init__(*args, env_name="MiniGrid-MultiRoom-N6-v0", **kwargs)
 
 
-registration.register(
-    id="MiniHack-LockedMultiRoom-N2-v0",
-    entry_point="minihack.envs.minigrid:MiniHackMultiRoomN2Locked",
-)
-registration.register(
-    id="MiniHack-LockedMultiRoom-N4-v0",
-    entry_point="minihack.envs.minigrid:MiniHackMultiRoomN4Locked",
-)
-registration.register(
-    id="MiniHack-LockedMultiRoom-N6-v0",
-    entry_point="minihack.envs.minigrid:MiniHackMultiRoomN6Locked",
-)
-
-
 # MiniGrid: LavaMultiRoom
 class MiniHackMultiRoomN2Lava(MiniGridHack):
     def __init__(self, *args, **kwargs):
@@ -198,20 +169,6 @@ class MiniHackMultiRoomN6Lava(MiniGridHack):
         super().__init__(*args, env_name="MiniGrid-MultiRoom-N6-v0", **kwargs)
 
 
-registration.register(
-    id="MiniHack-LavaMultiRoom-N2-v0",
-    entry_point="minihack.envs.minigrid:MiniHackMultiRoomN2Lava",
-)
-registration.register(
-    id="MiniHack-LavaMultiRoom-N4-v0",
-    entry_point="minihack.envs.minigrid:MiniHackMultiRoomN4Lava",
-)
-registration.register(
-    id="MiniHack-LavaMultiRoom-N6-v0",
-    entry_point="minihack.envs.minigrid:MiniHackMultiRoomN6Lava",
-)
-
-
 # MiniGrid: MonsterpedMultiRoom
 class MiniHackMultiRoomN2Monster(MiniGridHack):
     def __init__(self, *args, **kwargs):
@@ -234,21 +191,6 @@ class MiniHackMultiRoomN6Monster(MiniGridHack):
         super().__init__(*args, env_name="MiniGrid-MultiRoom-N6-v0", **kwargs)
 
 
-# MiniGrid: MonsterMultiRoom
-registration.register(
-    id="MiniHack-MonsterMultiRoom-N2-v0",
-    entry_point="minihack.envs.minigrid:MiniHackMultiRoomN2Monster",
-)
-registration.register(
-    id="MiniHack-MonsterMultiRoom-N4-v0",
-    entry_point="minihack.envs.minigrid:MiniHackMultiRoomN4Monster",
-)
-registration.register(
-    id="MiniHack-MonsterMultiRoom-N6-v0",
-    entry_point="minihack.envs.minigrid:MiniHackMultiRoomN6Monster",
-)
-
-
 # MiniGrid: ExtremeMultiRoom
 class MiniHackMultiRoomN2Extreme(MiniGridHack):
     def __init__(self, *args, **kwargs):
@@ -275,61 +217,3 @@ class MiniHackMultiRoomN6Extreme(MiniGridHack):
         kwargs["lava_walls"] = True
         kwargs["door_state"] = "locked"
         super().__init__(*args, env_name="MiniGrid-MultiRoom-N6-v0", **kwargs)
-
-
-registration.register(
-    id="MiniHack-ExtremeMultiRoom-N2-v0",
-    entry_point="minihack.envs.minigrid:MiniHackMultiRoomN2Extreme",
-)
-registration.register(
-    id="MiniHack-ExtremeMultiRoom-N4-v0",
-    entry_point="minihack.envs.minigrid:MiniHackMultiRoomN4Extreme",
-)
-registration.register(
-    id="MiniHack-ExtremeMultiRoom-N6-v0",
-    entry_point="minihack.envs.minigrid:MiniHackMultiRoomN6Extreme",
-)
-
-# MiniGrid: LavaCrossing
-registration.register(
-    id="MiniHack-LavaCrossingS9N1-v0",
-    entry_point="minihack.envs.minigrid:MiniGridHack",
-    kwargs={"env_name": "MiniGrid-LavaCrossingS9N1-v0"},
-)
-registration.register(
-    id="MiniHack-LavaCrossingS9N2-v0",
-    entry_point="minihack.envs.minigrid:MiniGridHack",
-    kwargs={"env_name": "MiniGrid-LavaCrossingS9N2-v0"},
-)
-registration.register(
-    id="MiniHack-LavaCrossingS9N3-v0",
-    entry_point="minihack.envs.minigrid:MiniGridHack",
-    kwargs={"env_name": "MiniGrid-LavaCrossingS9N3-v0"},
-)
-registration.register(
-    id="MiniHack-LavaCrossingS11N5-v0",
-    entry_point="minihack.envs.minigrid:MiniGridHack",
-    kwargs={"env_name": "MiniGrid-LavaCrossingS11N5-v0"},
-)
-
-# MiniGrid: Simple Crossing
-registration.register(
-    id="MiniHack-SimpleCrossingS9N1-v0",
-    entry_point="minihack.envs.minigrid:MiniGridHack",
-    kwargs={"env_name": "MiniGrid-SimpleCrossingS9N1-v0"},
-)
-registration.register(
-    id="MiniHack-SimpleCrossingS9N2-v0",
-    entry_point="minihack.envs.minigrid:MiniGridHack",
-    kwargs={"env_name": "MiniGrid-SimpleCrossingS9N2-v0"},
-)
-registration.register(
-    id="MiniHack-SimpleCrossingS9N3-v0",
-    entry_point="minihack.envs.minigrid:MiniGridHack",
-    kwargs={"env_name": "MiniGrid-SimpleCrossingS9N3-v0"},
-)
-registration.register(
-    id="MiniHack-SimpleCrossingS11N5-v0",
-    entry_point="minihack.envs.minigrid:MiniGridHack",
-    kwargs={"env_name": "MiniGrid-SimpleCrossingS11N5-v0"},
-)
@@ -1,5 +1,4 @@
 from nle.minihack import MiniHackNavigation, LevelGenerator
-from gym.envs import registration
 
 
 class MiniHackRiver(MiniHackNavigation):
@@ -76,29 +75,3 @@ class MiniHackRiverMonsterLava(MiniHackRiver):
 class MiniHackRiverNarrow(MiniHackRiver):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, narrow=True, **kwargs)
-
-
-registration.register(
-    id="MiniHack-River-v0",
-    entry_point="nle.minihack.envs.river:MiniHackRiver",
-)
-
-registration.register(
-    id="MiniHack-River-Monster-v0",
-    entry_point="nle.minihack.envs.river:MiniHackRiverMonster",
-)
-
-registration.register(
-    id="MiniHack-River-Lava-v0",
-    entry_point="nle.minihack.envs.river:MiniHackRiverLava",
-)
-
-registration.register(
-    id="MiniHack-River-MonsterLava-v0",
-    entry_point="nle.minihack.envs.river:MiniHackRiverMonsterLava",
-)
-
-registration.register(
-    id="MiniHack-River-Narrow-v0",
-    entry_point="nle.minihack.envs.river:MiniHackRiverNarrow",
-)
@@ -1,6 +1,5 @@
 from nle.minihack import MiniHackNavigation
 from nle.minihack import LevelGenerator
-from gym.envs import registration
 
 
 class MiniHackRoom(MiniHackNavigation):
@@ -59,32 +58,6 @@ class MiniHackRoom5x5Ultimate(MiniHackRoom):
         )
 
 
-registration.register(
-    id="MiniHack-Room-5x5-v0",
-    entry_point="nle.minihack.envs.room:MiniHackRoom5x5",
-)
-registration.register(
-    id="MiniHack-Room-Random-5x5-v0",
-    entry_point="nle.minihack.envs.room:MiniHack5x5Random",
-)
-registration.register(
-    id="MiniHack-Room-Dark-5x5-v0",
-    entry_point="nle.minihack.envs.room:MiniHackRoom5x5Dark",
-)
-registration.register(
-    id="MiniHack-Room-Monster-5x5-v0",
-    entry_point="nle.minihack.envs.room:MiniHackRoom5x5Monster",
-)
-registration.register(
-    id="MiniHack-Room-Trap-5x5-v0",
-    entry_point="nle.minihack.envs.room:MiniHackRoom5x5Trap",
-)
-registration.register(
-    id="MiniHack-Room-Ultimate-5x5-v0",
-    entry_point="nle.minihack.envs.room:MiniHackRoom5x5Ultimate",
-)
-
-
 class MiniHackRoom15x15(MiniHackRoom):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, size=15, random=False, **kwargs)
@@ -115,29 +88,3 @@ class MiniHackRoom15x15Ultimate(MiniHackRoom):
         super().__init__(
             *args, size=15, random=True, lit=False, n_monster=3, n_trap=15, **kwargs
         )
-
-
-registration.register(
-    id="MiniHack-Room-15x15-v0",
-    entry_point="nle.minihack.envs.room:MiniHackRoom15x15",
-)
-registration.register(
-    id="MiniHack-Room-Random-15x15-v0",
-    entry_point="nle.minihack.envs.room:MiniHackRoom15x15Random",
-)
-registration.register(
-    id="MiniHack-Room-Dark-15x15-v0",
-    entry_point="nle.minihack.envs.room:MiniHackRoom15x15Dark",
-)
-registration.register(
-    id="MiniHack-Room-Monster-15x15-v0",
-    entry_point="nle.minihack.envs.room:MiniHackRoom15x15Monster",
-)
-registration.register(
-    id="MiniHack-Room-Trap-15x15-v0",
-    entry_point="nle.minihack.envs.room:MiniHackRoom15x15Trap",
-)
-registration.register(
-    id="MiniHack-Room-Ultimate-15x15-v0",
-    entry_point="nle.minihack.envs.room:MiniHackRoom15x15Ultimate",
-)
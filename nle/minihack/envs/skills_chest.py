@@ -1,5 +1,4 @@
 from nle.minihack import MiniHackSkill, RewardManager
-from gym.envs import registration
 
 
 class MiniHackUnlock(MiniHackSkill):
@@ -27,17 +26,3 @@ class MiniHackUnlockEat(MiniHackSkill):
         super().__init__(
             *args, des_file="chest.des", reward_manager=rwrd_mngr, **kwargs
         )
-
-
-registration.register(
-    id="MiniHack-Unlock-v0",
-    entry_point="nle.minihack.envs.skills_chest:MiniHackUnlock",
-)
-registration.register(
-    id="MiniHack-UnlockLoot-v0",
-    entry_point="nle.minihack.envs.skills_chest:MiniHackUnlockLoot",
-)
-registration.register(
-    id="MiniHack-UnlockEat-v0",
-    entry_point="nle.minihack.envs.skills_chest:MiniHackUnlockEat",
-)
@@ -1,5 +1,4 @@
 from nle.minihack import MiniHackSkill, LevelGenerator, RewardManager
-from gym.envs import registration
 
 freeze_msgs = [
     "The bolt of cold bounces!",  # checks if cold bounces from the wall
@@ -90,21 +89,3 @@ BRANCH:(1,1,5,5),(0,0,0,0)
 STAIR:rndcoord($right_bank),down
 """
         super().__init__(*args, des_file=des_file, **kwargs)
-
-
-registration.register(
-    id="MiniHack-Freeze-Wand-v0",
-    entry_point="nle.minihack.envs.skills_freeze:MiniHackFreezeWand",
-)
-registration.register(
-    id="MiniHack-Freeze-Horn-v0",
-    entry_point="nle.minihack.envs.skills_freeze:MiniHackFreezeHorn",
-)
-registration.register(
-    id="MiniHack-Freeze-Random-v0",
-    entry_point="nle.minihack.envs.skills_freeze:MiniHackFreezeRandom",
-)
-registration.register(
-    id="MiniHack-Freeze-Lava-v0",
-    entry_point="nle.minihack.envs.skills_freeze:MiniHackFreezeLava",
-)
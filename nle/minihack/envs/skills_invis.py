@@ -1,5 +1,4 @@
 from nle.minihack import MiniHackSkill, LevelGenerator, RewardManager
-from gym.envs import registration
 
 invis_msgs = [
     "All of a sudden, you can't see yourself",
@@ -91,29 +90,3 @@ IF [25%] {
 class MiniHackInvisRandomDist(MiniHackInvisRandom):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, n_distract=3, **kwargs)
-
-
-registration.register(
-    id="MiniHack-Invis-Potion-v0",
-    entry_point="nle.minihack.envs.skills_invis:MiniHackInvisPotion",
-)
-registration.register(
-    id="MiniHack-Invis-Ring-v0",
-    entry_point="nle.minihack.envs.skills_invis:MiniHackInvisRing",
-)
-registration.register(
-    id="MiniHack-Invis-Wand-v0",
-    entry_point="nle.minihack.envs.skills_invis:MiniHackInvisWand",
-)
-registration.register(
-    id="MiniHack-Invis-Cloak-v0",
-    entry_point="nle.minihack.envs.skills_invis:MiniHackInvisCloak",
-)
-registration.register(
-    id="MiniHack-Invis-Random-v0",
-    entry_point="nle.minihack.envs.skills_invis:MiniHackInvisRandom",
-)
-registration.register(
-    id="MiniHack-Invis-Random-Distract-v0",
-    entry_point="nle.minihack.envs.skills_invis:MiniHackInvisRandomDist",
-)
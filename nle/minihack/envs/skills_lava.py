@@ -1,5 +1,4 @@
 from nle.minihack import MiniHackSkill
-from gym.envs import registration
 
 
 class MiniHackLCLevitatePotionPickup(MiniHackSkill):
@@ -152,29 +151,3 @@ STAIR:rndcoord($right_bank),down
 class MiniHackLC(MiniHackSkill):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, des_file="lava_crossing.des", **kwargs)
-
-
-registration.register(
-    id="MiniHack-LavaCross-Levitate-Potion-Pickup-v0",
-    entry_point="nle.minihack.envs.skills_lava:MiniHackLCLevitatePotionPickup",
-)
-registration.register(
-    id="MiniHack-LavaCross-Levitate-Potion-Inv-v0",
-    entry_point="nle.minihack.envs.skills_lava:MiniHackLCLevitatePotionInv",
-)
-registration.register(
-    id="MiniHack-LavaCross-Levitate-Ring-Pickup-v0",
-    entry_point="nle.minihack.envs.skills_lava:MiniHackLCLevitateRingPickup",
-)
-registration.register(
-    id="MiniHack-LavaCross-Levitate-Ring-Inv-v0",
-    entry_point="nle.minihack.envs.skills_lava:MiniHackLCLevitateRingInv",
-)
-registration.register(
-    id="MiniHack-LavaCross-Levitate-v0",
-    entry_point="nle.minihack.envs.skills_lava:MiniHackLCLevitate",
-)
-registration.register(
-    id="MiniHack-LavaCross-v0",
-    entry_point="nle.minihack.envs.skills_lava:MiniHackLC",
-)
@@ -1,5 +1,4 @@
 from nle.minihack import MiniHackSkill, LevelGenerator, RewardManager
-from gym.envs import registration
 
 
 levitation_msg = [
@@ -103,33 +102,3 @@ IF [33%] {
 }
 """
         super().__init__(*args, des_file=des_file, **kwargs)
-
-
-registration.register(
-    id="MiniHack-Levitate-Boots-v0",
-    entry_point="nle.minihack.envs.skills_levitate:MiniHackLevitateBoots",
-)
-registration.register(
-    id="MiniHack-Levitate-Ring-v0",
-    entry_point="nle.minihack.envs.skills_levitate:MiniHackLevitateRing",
-)
-registration.register(
-    id="MiniHack-Levitate-Potion-v0",
-    entry_point="nle.minihack.envs.skills_levitate:MiniHackLevitatePotion",
-)
-registration.register(
-    id="MiniHack-Levitate-Random-v0",
-    entry_point="nle.minihack.envs.skills_levitate:MiniHackLevitateRandom",
-)
-registration.register(
-    id="MiniHack-Levitate-Boots-Fixed-v0",
-    entry_point="nle.minihack.envs.skills_levitate:MiniHackLevitateBootsFixed",
-)
-registration.register(
-    id="MiniHack-Levitate-Ring-Fixed-v0",
-    entry_point="nle.minihack.envs.skills_levitate:MiniHackLevitateRingFixed",
-)
-registration.register(
-    id="MiniHack-Levitate-Potion-Fixed-v0",
-    entry_point="nle.minihack.envs.skills_levitate:MiniHackLevitatePotionFixed",
-)
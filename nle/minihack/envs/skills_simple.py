@@ -1,5 +1,4 @@
 from nle.minihack import MiniHackSkill, LevelGenerator, RewardManager
-from gym.envs import registration
 
 
 class MiniHackEat(MiniHackSkill):
@@ -429,120 +428,3 @@ class MiniHackLockedDoorFixed(MiniHackSkill):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, des_file="locked_door_fixed.des", **kwargs)
-
-
-# Tasks (w/o doors)
-registration.register(
-    id="MiniHack-Eat-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackEat",
-)
-registration.register(
-    id="MiniHack-Pray-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackPray",
-)
-registration.register(
-    id="MiniHack-Sink-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackSink",
-)
-registration.register(
-    id="MiniHack-Wield-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackWield",
-)
-registration.register(
-    id="MiniHack-Wear-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackWear",
-)
-registration.register(
-    id="MiniHack-PutOn-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackPutOn",
-)
-registration.register(
-    id="MiniHack-Zap-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackZap",
-)
-registration.register(
-    id="MiniHack-Read-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackRead",
-)
-
-# Fixed version of tasks
-registration.register(
-    id="MiniHack-Eat-Fixed-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackEatFixed",
-)
-registration.register(
-    id="MiniHack-Pray-Fixed-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackPrayFixed",
-)
-registration.register(
-    id="MiniHack-Sink-Fixed-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackSinkFixed",
-)
-registration.register(
-    id="MiniHack-Wield-Fixed-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackWieldFixed",
-)
-registration.register(
-    id="MiniHack-Wear-Fixed-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackWearFixed",
-)
-registration.register(
-    id="MiniHack-PutOn-Fixed-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackPutOnFixed",
-)
-registration.register(
-    id="MiniHack-Zap-Fixed-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackZapFixed",
-)
-registration.register(
-    id="MiniHack-Read-Fixed-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackReadFixed",
-)
-
-# Task versions with random distractions
-registration.register(
-    id="MiniHack-Eat-Distr-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackEatDistr",
-)
-registration.register(
-    id="MiniHack-Pray-Distr-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackPrayDistr",
-)
-registration.register(
-    id="MiniHack-Sink-Distr-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackSinkDistr",
-)
-registration.register(
-    id="MiniHack-Wield-Distr-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackWieldDistr",
-)
-registration.register(
-    id="MiniHack-Wear-Distr-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackWearDistr",
-)
-registration.register(
-    id="MiniHack-PutOn-Distr-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackPutOnDistr",
-)
-registration.register(
-    id="MiniHack-Zap-Distr-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackZapDistr",
-)
-registration.register(
-    id="MiniHack-Read-Distr-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackReadDistr",
-)
-
-# Tasks involvign doors
-registration.register(
-    id="MiniHack-ClosedDoor-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackClosedDoor",
-)
-registration.register(
-    id="MiniHack-LockedDoor-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackLockedDoor",
-)
-registration.register(
-    id="MiniHack-LockedDoor-Fixed-v0",
-    entry_point="nle.minihack.envs.skills_simple:MiniHackLockedDoorFixed",
-)
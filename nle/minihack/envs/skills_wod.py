@@ -1,5 +1,4 @@
 from nle.minihack import MiniHackSkill, LevelGenerator, RewardManager
-from gym.envs import registration
 
 
 class MiniHackWoDEasy(MiniHackSkill):
@@ -117,22 +116,3 @@ class MiniHackWoDPro(MiniHackSkill):
             des_file=des_file,
             **kwargs,
         )
-
-
-registration.register(
-    id="MiniHack-WoD-Easy-v0",
-    entry_point="nle.minihack.envs.skills_wod:MiniHackWoDEasy",
-)
-
-registration.register(
-    id="MiniHack-WoD-Medium-v0",
-    entry_point="nle.minihack.envs.skills_wod:MiniHackWoDMedium",
-)
-registration.register(
-    id="MiniHack-WoD-Hard-v0",
-    entry_point="nle.minihack.envs.skills_wod:MiniHackWoDHard",
-)
-registration.register(
-    id="MiniHack-WoD-Pro-v0",
-    entry_point="nle.minihack.envs.skills_wod:MiniHackWoDExtreme",
-)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import enum
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, cast, Tuple, Any, Callable, TYPE_CHECKING
+from typing import List, cast, Tuple, Any, Callable, Optional, Set, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from nle.minihack import MiniHack
@@ -94,6 +94,11 @@ class AbstractRewardManager(ABC):
     def reset(self) -> None:
         raise NotImplementedError
 
+    def required_obs_keys(self) -> Optional[Set[str]]:
+        """Observation keys read from the previous observation, or None if
+        all of them are required (the default)."""
+        return None
+
 
 class RewardManager(AbstractRewardManager):
     """This class is used for managing rewards, events and termination for
@@ -101,8 +106,9 @@ class RewardManager(AbstractRewardManager):
 
     Some notes on the ordering or calls in the MiniHack/NetHack base class:
     * `step(action)` is called on the environment
-    * Within `step`, first a copy of the last observation is made, and then the
-      underlying NetHack game is stepped
+    * Within `step`, first a copy of the parts of the last observation listed
+      in `required_obs_keys` is made, and then the underlying NetHack game is
+      stepped
     * Then `_is_episode_end(observation)` is called to check whether this the
       episode has ended (and this is overridden if we've gone over our
       max_steps, or the underlying NetHack game says we're done (i.e. we died)
@@ -125,20 +131,35 @@ class RewardManager(AbstractRewardManager):
             Callable[[MiniHack, Any, int, Any], float]
         ] = []
         self._reward = 0.0
+        # None means the whole previous observation is required
+        self._required_obs_keys: Optional[Set[str]] = set()
 
         # Only used for GroupedRewardManager
         self.terminal_sufficient = None
         self.terminal_required = None
 
     def add_custom_reward_fn(
-        self, reward_fn: Callable[[MiniHack, Any, int, Any], float]
+        self,
+        reward_fn: Callable[[MiniHack, Any, int, Any], float],
+        required_obs_keys: Optional[List[str]] = None,
     ) -> None:
         """Add a custom reward function which is called every step to calculate reward.
 
         The function should be a callable which takes the environment, previous
         observation, action and current observation and returns a float reward.
+        The previous observation is a dict mapping observation keys to arrays.
+        Only the keys in required_obs_keys are copied into it, or all the
+        observation keys if required_obs_keys is None.
         """
         self.custom_reward_functions.append(reward_fn)
+        if required_obs_keys is None:
+            self._required_obs_keys = None
+        elif self._required_obs_keys is not None:
+            self._required_obs_keys.update(required_obs_keys)
+
+    def required_obs_keys(self) -> Optional[Set[str]]:
+        # Events only look at the current observation
+        return self._required_obs_keys
 
     def _add_message_event(
         self, msgs, reward, repeatable, terminal_required, terminal_sufficient
@@ -496,6 +517,15 @@ class GroupedRewardManager(AbstractRewardManager):
         reward_manager.terminal_sufficient = terminal_sufficient
         self.reward_managers.append(reward_manager)
 
+    def required_obs_keys(self) -> Optional[Set[str]]:
+        keys: Set[str] = set()
+        for reward_manager in self.reward_managers:
+            rm_keys = reward_manager.required_obs_keys()
+            if rm_keys is None:
+                return None
+            keys.update(rm_keys)
+        return keys
+
     def collect_reward(self):
         reward = 0.0
         for reward_manager in self.reward_managers:
@@ -15,7 +15,13 @@ fi
 
 cd $VARDIR/lib
 
-cp $DESFILE mylevel.des
+# A des-file of "-" is read from stdin
+if [ "$DESFILE" = "-" ]
+then
+    cat > mylevel.des
+else
+    cp $DESFILE mylevel.des
+fi
 $HACKDIR/lev_comp mylevel.des
 rm -rf mylevel.des
 
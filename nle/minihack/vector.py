@@ -0,0 +1,147 @@
+# Copyright (c) Facebook, Inc. and its affiliates.
+
+import weakref
+
+import gym
+import numpy as np
+
+
+class MiniHackVecEnv(gym.vector.VectorEnv):
+    """Vectorized environment stepping several MiniHack environments in the
+    current process.
+
+    The observations of all environments are written into one contiguous
+    buffer of shape (num_envs, ...) per observation key. Cropped observations
+    are written by each environment directly into its row of the buffers, so
+    no observation arrays are allocated for them after construction.
+
+    With shared_memory=True, the buffers are backed by
+    multiprocessing.shared_memory blocks, whose names are given in
+    self.shm_names, so that e.g. a trainer in another process can attach to
+    them without copying.
+
+    As in gym's SyncVectorEnv, environments are reset automatically at the
+    end of their episode. The returned observations are the buffers
+    themselves and are overwritten by the following step.
+
+    The buffers are owned by the arrays returned to the caller: closing the
+    vectorized environment unlinks the shared memory blocks, so that no
+    other process can attach to them anymore, but the memory stays mapped
+    and the returned observations stay valid until they, and every view of
+    them, are garbage collected.
+    """
+
+    def __init__(self, env_fns, shared_memory=False):
+        self.envs = [env_fn() for env_fn in env_fns]
+        env = self.envs[0]
+        super().__init__(len(self.envs), env.observation_space, env.action_space)
+
+        # The MiniHack internals are read from the unwrapped environments,
+        # while reset and step go through the wrappers
+        names = env.unwrapped._minihack_obs_keys
+        flat_obs = isinstance(env.observation_space, gym.spaces.Tuple)
+        keys = list(range(len(names))) if flat_obs else list(names)
+
+        self._shms = []
+        self.shm_names = {}
+        self._bufs = {}
+        for key in keys:
+            space = self.single_observation_space[key]
+            shape = (self.num_envs,) + space.shape
+            self._bufs[key] = self._allocate(key, shape, space.dtype, shared_memory)
+
+        # Cropped observations are written in place, the others are copied
+        self._copy_keys = tuple(
+            key
+            for key, name in zip(keys, names)
+            if name not in env.unwrapped._crop_bufs
+        )
+        for i, env in enumerate(self.envs):
+            minihack = env.unwrapped
+            minihack._set_crop_bufs(
+                {
+                    name: self._bufs[key][i]
+                    for key, name in zip(keys, names)
+                    if name in minihack._crop_bufs
+                }
+            )
+
+        if flat_obs:
+            self._observations = tuple(self._bufs[key] for key in keys)
+        else:
+            self._observations = self._bufs
+        self._rewards = np.zeros((self.num_envs,), dtype=np.float64)
+        self._dones = np.zeros((self.num_envs,), dtype=np.bool_)
+        self._actions = None
+
+    def _allocate(self, key, shape, dtype, shared_memory):
+        dtype = np.dtype(dtype)
+        if not shared_memory:
+            return np.zeros(shape, dtype=dtype)
+
+        from multiprocessing.shared_memory import SharedMemory
+
+        size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        shm = SharedMemory(create=True, size=size)
+        self._shms.append(shm)
+        self.shm_names[key] = shm.name
+        buf = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        buf.fill(0)
+        # Views of buf keep it alive, so the memory is unmapped only once
+        # nothing can read it anymore
+        weakref.finalize(buf, _close_shm, shm).atexit = False
+        return buf
+
+    def _write_observation(self, i, observation):
+        for key in self._copy_keys:
+            np.copyto(self._bufs[key][i], observation[key])
+
+    def reset_async(self):
+        pass
+
+    def reset_wait(self, **kwargs):
+        self._dones[:] = False
+        for i, env in enumerate(self.envs):
+            self._write_observation(i, env.reset(**kwargs))
+        return self._observations
+
+    def step_async(self, actions):
+        self._actions = actions
+
+    def step_wait(self):
+        infos = []
+        for i, (env, action) in enumerate(zip(self.envs, self._actions)):
+            observation, self._rewards[i], self._dones[i], info = env.step(action)
+            if self._dones[i]:
+                observation = env.reset()
+            self._write_observation(i, observation)
+            infos.append(info)
+
+        return (
+            self._observations,
+            np.copy(self._rewards),
+            np.copy(self._dones),
+            infos,
+        )
+
+    def close_extras(self, **kwargs):
+        for env in self.envs:
+            env.close()
+            # Give the environment back buffers of its own
+            minihack = env.unwrapped
+            minihack._set_crop_bufs(
+                {key: buf.copy() for key, buf in minihack._crop_bufs.items()}
+            )
+        self._bufs = self._observations = None
+        # The memory is unmapped once the returned observations are collected
+        for shm in self._shms:
+            shm.unlink()
+        self._shms = []
+
+
+def _close_shm(shm):
+    try:
+        shm.close()
+    except BufferError:
+        # The mapping is released along with the last array exporting it
+        pass
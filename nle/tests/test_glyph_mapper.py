@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+#
+# Copyright (c) Facebook, Inc. and its affiliates.
+import numpy as np
+import pytest
+
+from nle import nethack
+from nle.tiles import GlyphMapper
+from nle.tiles.glyph_mapper import STONE_GLYPH
+
+
+@pytest.fixture(scope="module")
+def glyph_mapper():
+    return GlyphMapper()
+
+
+def reference_to_rgb(glyph_mapper, glyphs, chars):
+    """Maps the glyphs to RGB pixels one tile at a time."""
+    rows = []
+    for i in range(glyphs.shape[0]):
+        row = []
+        for j in range(glyphs.shape[1]):
+            glyph = glyphs[i, j]
+            if glyph == 0 and chars[i, j] != ord("a"):  # not a giant ant
+                glyph = 2359  # dark part of the room
+            row.append(glyph_mapper.glyph_id_to_rgb(glyph))
+        rows.append(np.concatenate(row, axis=1))
+    return np.concatenate(rows, axis=0)
+
+
+@pytest.mark.parametrize("shape", [(1, 1), (5, 5), nethack.DUNGEON_SHAPE])
+def test_to_rgb(glyph_mapper, shape):
+    rng = np.random.RandomState(0)
+    glyphs = rng.randint(0, nethack.MAX_GLYPH, size=shape).astype(np.int16)
+    chars = rng.randint(0, 128, size=shape).astype(np.uint8)
+
+    rgb = glyph_mapper.to_rgb(glyphs, chars)
+
+    assert rgb.shape == (shape[0] * 16, shape[1] * 16, 3)
+    np.testing.assert_array_equal(rgb, reference_to_rgb(glyph_mapper, glyphs, chars))
+
+
+@pytest.mark.parametrize("char", [ord("a"), ord(" "), ord("#")])
+def test_zero_glyph(glyph_mapper, char):
+    glyphs = np.zeros((2, 3), dtype=np.int16)
+    chars = np.full((2, 3), char, dtype=np.uint8)
+
+    rgb = glyph_mapper.to_rgb(glyphs, chars)
+
+    np.testing.assert_array_equal(rgb, reference_to_rgb(glyph_mapper, glyphs, chars))
+    # Giant ants are drawn as such, other glyphs with 0 ID as dark room
+    expected_glyph = 0 if char == ord("a") else 2359
+    np.testing.assert_array_equal(
+        rgb[:16, :16], glyph_mapper.glyph_id_to_rgb(expected_glyph)
+    )
+
+
+def test_stone_glyph():
+    # The glyph the original implementation drew for the dark part of the room
+    assert STONE_GLYPH == 2359
@@ -0,0 +1,525 @@
+#!/usr/bin/env python
+#
+# Copyright (c) Facebook, Inc. and its affiliates.
+import functools
+import os
+import subprocess
+
+import numpy as np
+import pytest
+import gym
+
+import nle.minihack  # noqa: F401
+from nle import nethack
+from nle.minihack import MiniHack, MiniHackVecEnv
+from nle.minihack import _fast
+from nle.minihack.base import MH_FULL_ACTIONS, PATCH_SCRIPT
+from nle.tiles import GlyphMapper
+from nle.minihack.reward_manager import (
+    AbstractRewardManager,
+    GroupedRewardManager,
+    RewardManager,
+)
+
+
+def set_description(descriptions, x, y, text):
+    encoded = text.encode("utf-8")
+    descriptions[y, x, :] = 0
+    descriptions[y, x, : len(encoded)] = np.frombuffer(encoded, dtype=np.uint8)
+
+
+class TestNeighborDescriptions:
+    @pytest.yield_fixture(autouse=True)  # will be applied to all tests in class
+    def make_cwd_tmp(self, tmpdir):
+        """Makes cwd point to the test's tmpdir."""
+        with tmpdir.as_cwd():
+            yield
+
+    @pytest.fixture
+    def env(self):
+        e = gym.make("MiniHack-Room-5x5-v0")
+        e.reset()
+        try:
+            yield e
+        finally:
+            e.close()
+
+    def make_observation(self, env, x, y):
+        """Returns a copy of the last observation with the agent at (x, y)
+        and each tile of the map described by its coordinates."""
+        observation = [a.copy() for a in env.last_observation]
+        observation[env._blstats_index][:2] = (x, y)
+        descriptions = observation[env._scr_descr_index]
+        h, w = descriptions.shape[:2]
+        for j in range(h):
+            for i in range(w):
+                set_description(descriptions, i, j, f"{i},{j}")
+        return tuple(observation)
+
+    def test_inside_map(self, env):
+        observation = self.make_observation(env, 10, 10)
+        neighbors = env.get_neighbor_descriptions(observation)
+        assert neighbors == [f"{i},{j}" for j in range(9, 12) for i in range(9, 12)]
+
+    @pytest.mark.parametrize(
+        "x,y",
+        [
+            (0, 0),
+            (0, 10),
+            (10, 0),
+            (nethack.DUNGEON_SHAPE[1] - 1, nethack.DUNGEON_SHAPE[0] - 1),
+        ],
+    )
+    def test_map_edges(self, env, x, y):
+        h, w = nethack.DUNGEON_SHAPE
+        observation = self.make_observation(env, x, y)
+        neighbors = env.get_neighbor_descriptions(observation)
+        assert len(neighbors) == 9
+        expected = [
+            f"{i},{j}" if 0 <= i < w and 0 <= j < h else ""
+            for j in range(y - 1, y + 2)
+            for i in range(x - 1, x + 2)
+        ]
+        assert neighbors == expected
+
+    def test_direction_at_edge(self, env):
+        observation = self.make_observation(env, 0, 0)
+        # The tile to the right of the agent
+        assert env.get_direction_obj("1,0", observation) == ord("l")
+
+
+def reference_crop(obs, x, y, crop_h, crop_w, pad):
+    """Crops obs around (x, y) by padding the whole map first."""
+    dh, dw = crop_h // 2, crop_w // 2
+    pad_width = ((dh, dh), (dw, dw)) + ((0, 0),) * (obs.ndim - 2)
+    padded = np.pad(obs, pad_width, mode="constant", constant_values=pad)
+    return padded[y : y + crop_h, x : x + crop_w]
+
+
+class TestCrop:
+    crop_h = 3
+    crop_w = 5
+    pad = 7
+
+    @pytest.yield_fixture(autouse=True)  # will be applied to all tests in class
+    def make_cwd_tmp(self, tmpdir):
+        """Makes cwd point to the test's tmpdir."""
+        with tmpdir.as_cwd():
+            yield
+
+    @pytest.fixture(params=[False, True], ids=["dict", "flat"])
+    def env(self, request):
+        e = gym.make(
+            "MiniHack-Room-5x5-v0",
+            observation_keys=("glyphs_crop", "screen_descriptions_crop"),
+            obs_crop_h=self.crop_h,
+            obs_crop_w=self.crop_w,
+            obs_crop_pad=self.pad,
+            flat_obs=request.param,
+        )
+        try:
+            yield e
+        finally:
+            e.close()
+
+    @pytest.fixture(params=["numpy", "numba"])
+    def crop_fn(self, request, env):
+        """Returns each implementation of MiniHack's observation cropping."""
+        env = env.unwrapped
+        if request.param == "numpy":
+            return functools.partial(MiniHack._crop_observation, env)
+        kernel = _fast.get_crop_observation()
+        if kernel is None:
+            pytest.skip("numba is not installed")
+
+        def crop(obs, loc, buf):
+            x, y = int(loc[0]), int(loc[1])
+            return kernel(obs, x, y, env._dh, env._dw, env.obs_crop_pad, buf)
+
+        return crop
+
+    @pytest.mark.parametrize(
+        "x,y",
+        [
+            (0, 0),
+            (1, 0),
+            (0, 1),
+            (10, 10),
+            (nethack.DUNGEON_SHAPE[1] - 1, nethack.DUNGEON_SHAPE[0] - 1),
+            (nethack.DUNGEON_SHAPE[1] - 2, 1),
+        ],
+    )
+    def test_crop_near_edges(self, crop_fn, x, y):
+        h, w = nethack.DUNGEON_SHAPE
+        glyphs = np.arange(h * w, dtype=np.uint16).reshape(h, w)
+        buf = np.zeros((self.crop_h, self.crop_w), dtype=np.uint16)
+
+        crop = crop_fn(glyphs, (x, y), buf)
+
+        assert crop.shape == (self.crop_h, self.crop_w)
+        np.testing.assert_array_equal(
+            crop, reference_crop(glyphs, x, y, self.crop_h, self.crop_w, self.pad)
+        )
+
+    def test_crop_unsigned_loc(self, crop_fn):
+        # tty_cursor is unsigned, so x - dw must not wrap around
+        h, w = nethack.DUNGEON_SHAPE
+        chars = np.arange(h * w, dtype=np.uint8).reshape(h, w)
+        buf = np.zeros((self.crop_h, self.crop_w), dtype=np.uint8)
+        loc = np.array([0, 0], dtype=np.uint8)
+
+        crop = crop_fn(chars, loc, buf)
+
+        np.testing.assert_array_equal(
+            crop, reference_crop(chars, 0, 0, self.crop_h, self.crop_w, self.pad)
+        )
+
+    def test_screen_descriptions_crop(self, crop_fn):
+        descriptions = np.random.randint(
+            0, 128, size=nethack.SCREEN_DESCRIPTIONS_SHAPE, dtype=np.uint8
+        )
+        length = descriptions.shape[-1]
+        buf = np.zeros((self.crop_h, self.crop_w, length), dtype=np.uint8)
+
+        crop = crop_fn(descriptions, (1, 1), buf)
+
+        # The description axis is copied as is, never padded
+        assert crop.shape == (self.crop_h, self.crop_w, length)
+        np.testing.assert_array_equal(
+            crop,
+            reference_crop(descriptions, 1, 1, self.crop_h, self.crop_w, self.pad),
+        )
+
+    def test_observation(self, env):
+        obs = env.reset()
+        if isinstance(obs, tuple):
+            # flat_obs returns the observations in observation_keys order
+            assert isinstance(env.observation_space, gym.spaces.Tuple)
+            glyphs_crop, descriptions_crop = obs
+        else:
+            assert isinstance(env.observation_space, gym.spaces.Dict)
+            glyphs_crop = obs["glyphs_crop"]
+            descriptions_crop = obs["screen_descriptions_crop"]
+        assert env.observation_space.contains(obs)
+
+        x, y = env.last_observation[env._blstats_index][:2]
+        glyphs = env.last_observation[env._glyph_index]
+        descriptions = env.last_observation[env._scr_descr_index]
+        np.testing.assert_array_equal(
+            glyphs_crop,
+            reference_crop(glyphs, x, y, self.crop_h, self.crop_w, self.pad),
+        )
+        np.testing.assert_array_equal(
+            descriptions_crop,
+            reference_crop(descriptions, x, y, self.crop_h, self.crop_w, self.pad),
+        )
+
+
+class TestPixelCrop:
+    @pytest.yield_fixture(autouse=True)  # will be applied to all tests in class
+    def make_cwd_tmp(self, tmpdir):
+        """Makes cwd point to the test's tmpdir."""
+        with tmpdir.as_cwd():
+            yield
+
+    @pytest.fixture
+    def env(self):
+        e = gym.make("MiniHack-Room-5x5-v0", observation_keys=("pixel", "pixel_crop"))
+        e.reset()
+        try:
+            yield e
+        finally:
+            e.close()
+
+    @pytest.mark.parametrize(
+        "x,y",
+        [
+            (10, 10),
+            (0, 0),
+            (nethack.DUNGEON_SHAPE[1] - 1, 10),
+            (10, nethack.DUNGEON_SHAPE[0] - 1),
+            (nethack.DUNGEON_SHAPE[1] - 1, nethack.DUNGEON_SHAPE[0] - 1),
+        ],
+    )
+    def test_pixel_crop(self, env, x, y):
+        env = env.unwrapped
+        rng = np.random.RandomState(0)
+        observation = [a.copy() for a in env.last_observation]
+        observation[env._blstats_index][:2] = (x, y)
+        glyphs = observation[env._glyph_index]
+        glyphs[:] = rng.randint(0, nethack.MAX_GLYPH, size=glyphs.shape)
+        # Include glyphs with 0 ID, both giant ants and not
+        glyphs[y, x] = 0
+        chars = observation[env._chars_index]
+        chars[:] = rng.randint(0, 128, size=chars.shape)
+        chars[y, x] = ord("a")
+
+        obs = env._get_observation(tuple(observation))
+
+        # Inside the map the crop is sliced from the pixel observation, at
+        # the edges it is rendered from the cropped glyphs
+        h, w = nethack.DUNGEON_SHAPE
+        dh, dw = env.obs_crop_h // 2, env.obs_crop_w // 2
+        inside = dw <= x < w - dw and dh <= y < h - dh
+        assert np.shares_memory(obs["pixel_crop"], obs["pixel"]) == inside
+
+        expected = GlyphMapper().to_rgb(obs["glyphs_crop"], obs["chars_crop"])
+        np.testing.assert_array_equal(obs["pixel_crop"], expected)
+        np.testing.assert_array_equal(obs["pixel"], GlyphMapper().to_rgb(glyphs, chars))
+
+
+class TestRequiredObsKeys:
+    @pytest.yield_fixture(autouse=True)  # will be applied to all tests in class
+    def make_cwd_tmp(self, tmpdir):
+        """Makes cwd point to the test's tmpdir."""
+        with tmpdir.as_cwd():
+            yield
+
+    def test_events_need_no_keys(self):
+        reward_manager = RewardManager()
+        reward_manager.add_message_event(["squeak"])
+        reward_manager.add_coordinate_event((1, 1))
+        assert reward_manager.required_obs_keys() == set()
+
+    def test_custom_reward_fn_keys(self):
+        reward_manager = RewardManager()
+        reward_manager.add_custom_reward_fn(lambda *_: 0, required_obs_keys=["chars"])
+        reward_manager.add_custom_reward_fn(lambda *_: 0, required_obs_keys=["glyphs"])
+        assert reward_manager.required_obs_keys() == {"chars", "glyphs"}
+
+        # Without explicit keys, the whole observation is required
+        reward_manager.add_custom_reward_fn(lambda *_: 0)
+        assert reward_manager.required_obs_keys() is None
+
+    def test_grouped_reward_manager(self):
+        first, second = RewardManager(), RewardManager()
+        first.add_custom_reward_fn(lambda *_: 0, required_obs_keys=["chars"])
+        grouped = GroupedRewardManager()
+        grouped.add_reward_manager(first, True, False)
+        grouped.add_reward_manager(second, True, False)
+        assert grouped.required_obs_keys() == {"chars"}
+
+        second.add_custom_reward_fn(lambda *_: 0)
+        assert grouped.required_obs_keys() is None
+
+    def test_abstract_default(self):
+        class MyRewardManager(AbstractRewardManager):
+            def collect_reward(self):
+                return 0.0
+
+            def check_episode_end_call(self, env, prev_obs, action, obs):
+                return False
+
+            def reset(self):
+                pass
+
+        assert MyRewardManager().required_obs_keys() is None
+
+    def test_previous_observation(self):
+        previous_observations = []
+
+        def reward_fn(env, previous_observation, action, observation):
+            previous_observations.append(previous_observation)
+            return 0
+
+        reward_manager = RewardManager()
+        reward_manager.add_custom_reward_fn(reward_fn, required_obs_keys=["glyphs"])
+        env = gym.make("MiniHack-Room-5x5-v0", reward_manager=reward_manager)
+        try:
+            env.reset()
+            glyphs = env.last_observation[env._glyph_index].copy()
+            env.step(0)
+        finally:
+            env.close()
+
+        (previous_observation,) = previous_observations
+        assert list(previous_observation.keys()) == ["glyphs"]
+        np.testing.assert_array_equal(previous_observation["glyphs"], glyphs)
+
+    def test_unknown_key(self):
+        reward_manager = RewardManager()
+        reward_manager.add_custom_reward_fn(
+            lambda *_: 0, required_obs_keys=["not_an_observation"]
+        )
+        with pytest.raises(ValueError):
+            gym.make("MiniHack-Room-5x5-v0", reward_manager=reward_manager)
+
+
+class TestNhdatCache:
+    @pytest.fixture(autouse=True)
+    def cache_home(self, tmpdir, monkeypatch):
+        """Makes cwd point to the test's tmpdir and keeps the cache in it."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmpdir.join("cache")))
+        with tmpdir.as_cwd():
+            yield tmpdir.join("cache", "minihack", "nhdat")
+
+    @pytest.fixture
+    def patch_calls(self, monkeypatch):
+        """Records the calls to the nhdat patching script."""
+        calls = []
+        run = subprocess.run
+
+        def recording_run(args, *other_args, **kwargs):
+            if args[0] == PATCH_SCRIPT:
+                calls.append(args)
+            return run(args, *other_args, **kwargs)
+
+        monkeypatch.setattr(subprocess, "run", recording_run)
+        return calls
+
+    def make_corridor(self):
+        env = gym.make("MiniHack-Corridor-R2-v0")
+        try:
+            env.reset()
+        finally:
+            env.close()
+
+    def test_des_path_is_cached(self, cache_home, patch_calls):
+        self.make_corridor()
+        assert len(patch_calls) == 1
+        assert len(cache_home.listdir()) == 1
+
+        # The second environment copies the cached nhdat
+        self.make_corridor()
+        assert len(patch_calls) == 1
+        assert len(cache_home.listdir()) == 1
+
+    def test_des_string_is_not_cached(self, cache_home, patch_calls):
+        for _ in range(2):
+            env = gym.make("MiniHack-Room-5x5-v0")
+            env.close()
+        assert len(patch_calls) == 2
+        assert not os.path.exists(cache_home) or not cache_home.listdir()
+
+
+class CountResets(gym.Wrapper):
+    def __init__(self, env):
+        super().__init__(env)
+        self.num_resets = 0
+
+    def reset(self, **kwargs):
+        self.num_resets += 1
+        return self.env.reset(**kwargs)
+
+
+class TestVecEnv:
+    num_envs = 2
+    crop_keys = ("glyphs_crop", "chars_crop")
+    # Searching never ends the episode before max_episode_steps
+    actions = [MH_FULL_ACTIONS.index(nethack.Command.SEARCH)] * num_envs
+
+    @pytest.yield_fixture(autouse=True)  # will be applied to all tests in class
+    def make_cwd_tmp(self, tmpdir):
+        """Makes cwd point to the test's tmpdir."""
+        with tmpdir.as_cwd():
+            yield
+
+    @pytest.fixture(
+        params=[(False, False), (False, True), (True, False), (True, True)],
+        ids=["dict", "flat", "dict-shm", "flat-shm"],
+    )
+    def vec_env(self, request):
+        flat_obs, shared_memory = request.param
+
+        def make_env():
+            return CountResets(
+                gym.make(
+                    "MiniHack-Room-5x5-v0",
+                    observation_keys=("glyphs",) + self.crop_keys,
+                    max_episode_steps=2,
+                    actions=MH_FULL_ACTIONS,
+                    flat_obs=flat_obs,
+                )
+            )
+
+        e = MiniHackVecEnv([make_env] * self.num_envs, shared_memory=shared_memory)
+        try:
+            yield e
+        finally:
+            e.close()
+
+    def get(self, vec_env, observations, name):
+        """Returns the batch of observations with the given name."""
+        if isinstance(observations, tuple):
+            return observations[
+                vec_env.envs[0].unwrapped._minihack_obs_keys.index(name)
+            ]
+        return observations[name]
+
+    def check_observations(self, vec_env, observations):
+        for i, env in enumerate(vec_env.envs):
+            env = env.unwrapped
+            x, y = env.last_observation[env._blstats_index][:2]
+            glyphs = env.last_observation[env._glyph_index]
+            np.testing.assert_array_equal(
+                self.get(vec_env, observations, "glyphs")[i], glyphs
+            )
+            np.testing.assert_array_equal(
+                self.get(vec_env, observations, "glyphs_crop")[i],
+                reference_crop(glyphs, x, y, env.obs_crop_h, env.obs_crop_w, 0),
+            )
+
+    def test_reset(self, vec_env):
+        observations = vec_env.reset()
+        assert vec_env.observation_space.contains(observations)
+        for name in ("glyphs",) + self.crop_keys:
+            assert self.get(vec_env, observations, name).shape[0] == self.num_envs
+        self.check_observations(vec_env, observations)
+
+    def test_step(self, vec_env):
+        observations = vec_env.reset()
+        step_observations, rewards, dones, infos = vec_env.step(self.actions)
+        # The observations are written into the same buffers
+        assert step_observations is observations
+        assert rewards.shape == dones.shape == (self.num_envs,)
+        assert len(infos) == self.num_envs
+        self.check_observations(vec_env, observations)
+
+    def test_autoreset(self, vec_env):
+        observations = vec_env.reset()
+        _, _, dones, _ = vec_env.step(self.actions)
+        assert not dones.any()
+        _, _, dones, _ = vec_env.step(self.actions)
+        assert dones.all()
+        assert [env.num_resets for env in vec_env.envs] == [2] * self.num_envs
+        # The observations are those of the new episodes
+        self.check_observations(vec_env, observations)
+
+    def test_crop_rows_in_place(self, vec_env):
+        observations = vec_env.reset()
+        for i, env in enumerate(vec_env.envs):
+            env = env.unwrapped
+            for name in self.crop_keys:
+                row = self.get(vec_env, observations, name)[i]
+                assert np.shares_memory(env._crop_bufs[name], row)
+            # Non-cropped observations are copied
+            glyphs = self.get(vec_env, observations, "glyphs")[i]
+            assert not np.shares_memory(env.last_observation[env._glyph_index], glyphs)
+
+    def test_close(self, vec_env):
+        observations = vec_env.reset()
+        glyphs_crop = self.get(vec_env, observations, "glyphs_crop")
+        expected = glyphs_crop.copy()
+        vec_env.close()
+
+        # The observations returned before closing stay readable
+        np.testing.assert_array_equal(glyphs_crop, expected)
+        for env in vec_env.envs:
+            for buf in env.unwrapped._crop_bufs.values():
+                assert not np.shares_memory(buf, glyphs_crop)
+        # Closing again, e.g. when garbage collected, is a no-op
+        vec_env.close()
+
+
+def get_minihack_env_ids():
+    specs = gym.envs.registry.all()
+    return [spec.id for spec in specs if spec.id.startswith("MiniHack")]
+
+
+@pytest.mark.parametrize("env_name", get_minihack_env_ids())
+def test_entry_point(env_name):
+    # Environments are registered lazily, so broken entry points only show
+    # up when the environment is made
+    spec = gym.spec(env_name)
+    env_cls = gym.envs.registration.load(spec.entry_point)
+    assert issubclass(env_cls, MiniHack)
@@ -1,15 +1,28 @@
+from nle import nethack
 from nle.tiles import glyph2tile, MAXOTHTILE
 import numpy as np
 import pkg_resources
 import pickle
 import os
 
+# Glyph of the dark part of the room, shown instead of the glyphs with 0 ID
+# that aren't giant ants
+STONE_GLYPH = nethack.GLYPH_CMAP_OFF
+
 
 class GlyphMapper:
     """This class is used to map glyphs to rgb pixels."""
 
     def __init__(self):
         self.tiles = self.load_tiles()
+        # Lookup tables, so that mapping glyphs needs no Python loop
+        self.tile_table = np.stack(
+            [self.tiles[tile_id] for tile_id in range(max(self.tiles) + 1)]
+        )
+        self.glyph2tile = np.array(glyph2tile, dtype=np.int64)
+        # The (MAX_GLYPH, 16, 16, 3) table of the RGB tile of every glyph
+        self.glyph_table = self.tile_table[self.glyph2tile]
+        self.glyph_table.flags.writeable = False
 
     def load_tiles(self):
         """This function expects that tile.npy already exists.
@@ -31,35 +44,13 @@ class GlyphMapper:
         return self.tiles[tile_id]
 
     def _glyph_to_rgb(self, glyphs):
-        # TODO this can probably be imporved
         # Expects glhyphs as two-dimensional numpy ndarray
-        cols = None
-        col = None
-
-        for i in range(glyphs.shape[1]):
-            for j in range(glyphs.shape[0]):
-                rgb = self.glyph_id_to_rgb(glyphs[j, i])
-                if col is None:
-                    col = rgb
-                else:
-                    col = np.concatenate((col, rgb))
-
-            if cols is None:
-                cols = col
-            else:
-                cols = np.concatenate((cols, col), axis=1)
-            col = None
-
-        return cols
+        # Gathers the (h, w, 16, 16, 3) tiles and stitches them together
+        tiles = self.glyph_table[glyphs]
+        h, w, tile_h, tile_w, c = tiles.shape
+        return tiles.transpose(0, 2, 1, 3, 4).reshape(h * tile_h, w * tile_w, c)
 
     def to_rgb(self, glyphs, chars):
-        # Fix glyphs with 0 ID
-        glyphs = glyphs.copy()  # we might change it
-        zero_indices = np.argwhere(glyphs == 0)
-        for i, j in zero_indices:
-            if chars[i, j] == ord("a"):  # giant ant
-                continue
-            else:
-                glyphs[i, j] = 2359  # dark part of the room
-
+        # Fix glyphs with 0 ID, unless they truly are a giant ant
+        glyphs = np.where((glyphs == 0) & (chars != ord("a")), STONE_GLYPH, glyphs)
         return self._glyph_to_rgb(glyphs)
@@ -105,6 +105,7 @@ extras_deps = {
         "sphinx>=2.4.4",
         "sphinx-rtd-theme==0.4.3",
     ],
+    "numba": ["numba>=0.50"],
     "polybeast_agent": [
         "torch>=1.3.1",
         "hydra-core>=1.0.0",